@@ -0,0 +1,20 @@
+from python.helpers.api import ApiHandler, Request, Response
+from python.helpers import replicate_webhooks
+
+class ReplicateWebhook(ApiHandler):
+
+    # Called by Replicate, which has no session; the one-time token in the
+    # query string is what authorizes a delivery
+    @classmethod
+    def requires_auth(cls) -> bool:
+        return False
+
+    @classmethod
+    def requires_csrf(cls) -> bool:
+        return False
+
+    async def process(self, input: dict, request: Request) -> dict | Response:
+        token = request.args.get("token", "")
+        if not token or not replicate_webhooks.deliver(token, input):
+            return Response(response="Unknown webhook token", status=404, mimetype="text/plain")
+        return {"ok": True}
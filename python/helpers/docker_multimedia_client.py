@@ -5,12 +5,33 @@ Provides integration with LocalAI, Pollinations.AI, and Wan2GP containers
 
 import aiohttp
 import asyncio
+import atexit
 import base64
+import binascii
 import json
 import logging
+import weakref
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from python.helpers.print_style import PrintStyle
 
+@dataclass
+class GeneratedImage:
+    """Image returned by a multimedia service, decoded only when the bytes are needed"""
+    image_base64: str
+
+    @cached_property
+    def data(self) -> bytes:
+        # Single C-level pass straight to the output buffer
+        return binascii.a2b_base64(self.image_base64)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GeneratedImage":
+        image = cls(binascii.b2a_base64(data, newline=False).decode("ascii"))
+        image.__dict__["data"] = data
+        return image
+
 class DockerMultimediaClient:
     def __init__(self):
         """Initialize Docker multimedia service client"""
@@ -36,7 +57,10 @@ class DockerMultimediaClient:
     
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=300))
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=300),
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30),
+        )
         await self.check_services_health()
         return self
     
@@ -80,6 +104,19 @@ class DockerMultimediaClient:
     ) -> Optional[str]:
         """Generate image using Pollinations.AI Docker service"""
         
+        image = await self.generate_image_pollinations_result(prompt, width, height, style, seed)
+        return image.image_base64 if image else None
+    
+    async def generate_image_pollinations_result(
+        self, 
+        prompt: str, 
+        width: int = 1024, 
+        height: int = 1024,
+        style: Optional[str] = None,
+        seed: Optional[int] = None
+    ) -> Optional[GeneratedImage]:
+        """Generate image using Pollinations.AI Docker service, keeping raw bytes lazy"""
+        
         if not self.services['pollinations']['available']:
             PrintStyle(font_color="red").print("❌ Pollinations service not available")
             return None
@@ -109,7 +146,7 @@ class DockerMultimediaClient:
                     data = await response.json()
                     if data.get('success') and data.get('image_base64'):
                         PrintStyle(font_color="green").print("✅ Image generated successfully with Pollinations.AI")
-                        return data['image_base64']
+                        return GeneratedImage(data['image_base64'])
                     else:
                         PrintStyle(font_color="red").print(f"❌ Pollinations generation failed: {data.get('error', 'Unknown error')}")
                         return None
@@ -271,6 +308,35 @@ class DockerMultimediaClient:
         """Check if a specific service is available"""
         return self.services.get(service_name, {}).get('available', False)
 
+# Shared clients, one per event loop since an aiohttp session is bound to the loop it was created on
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, DockerMultimediaClient]" = weakref.WeakKeyDictionary()
+
+async def get_docker_client() -> DockerMultimediaClient:
+    """Return a long-lived client for the running loop, reusing its pooled connections"""
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.session is None or client.session.closed:
+        client = DockerMultimediaClient()
+        await client.__aenter__()
+        _shared_clients[loop] = client
+    return client
+
+async def close_docker_client():
+    """Close the shared client of the running loop, if any"""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client:
+        await client.__aexit__(None, None, None)
+
+@atexit.register
+def _close_shared_clients():
+    for loop, client in list(_shared_clients.items()):
+        if client.session and not client.session.closed and not loop.is_closed() and not loop.is_running():
+            try:
+                loop.run_until_complete(client.session.close())
+            except Exception:
+                pass
+    _shared_clients.clear()
+
 # Convenience functions for easy access
 async def create_docker_client():
     """Create and return a configured Docker multimedia client"""
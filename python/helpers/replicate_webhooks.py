@@ -0,0 +1,50 @@
+import asyncio
+import secrets
+import threading
+from typing import Any, Dict
+
+# Predictions waiting for their completion webhook, keyed by the one-time token
+# embedded in the webhook URL. Waiters may run on any event loop (tools use their
+# own asyncio.run loops) while deliveries arrive on web server threads.
+_pending: Dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+_lock = threading.Lock()
+
+
+def register() -> tuple[str, asyncio.Future]:
+    """Register a waiter on the running loop, returning its token and future"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    token = secrets.token_urlsafe(16)
+    with _lock:
+        _pending[token] = (loop, future)
+    return token, future
+
+
+def discard(token: str):
+    """Forget a waiter, whether or not its webhook arrived"""
+    with _lock:
+        _pending.pop(token, None)
+
+
+def deliver(token: str, payload: Dict[str, Any]) -> bool:
+    """Hand a webhook payload to its waiter; unknown or stale tokens are rejected"""
+    with _lock:
+        entry = _pending.pop(token, None)
+    if entry is None:
+        return False
+    loop, future = entry
+    try:
+        loop.call_soon_threadsafe(_resolve, future, payload)
+    except RuntimeError:
+        # The waiter's loop has already closed
+        return False
+    return True
+
+
+def _resolve(future: asyncio.Future, payload: Dict[str, Any]):
+    if not future.done():
+        future.set_result(payload)
+
+
+def webhook_url(base_url: str, token: str) -> str:
+    return f"{base_url.rstrip('/')}/replicate_webhook?token={token}"
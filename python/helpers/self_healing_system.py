@@ -5,7 +5,6 @@ and automatically restore Pareng Boyong to operational status
 """
 
 import asyncio
-import json
 import subprocess
 import time
 import psutil
@@ -18,6 +17,7 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 import threading
 import signal
+from collections import deque
 
 from python.helpers.log import Log
 from python.helpers.print_style import PrintStyle
@@ -74,7 +74,11 @@ class SystemHealthMonitor:
         self.monitoring = False
         self.health_history = []
         self.baseline_metrics = None
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        
+        # Latest probe result (monotonic timestamp, status) and the probe in flight
+        self._snapshot: tuple[float, Optional[SystemHealthStatus]] = (0.0, None)
+        self._snapshot_task: Optional[asyncio.Future] = None
         
         # Health thresholds
         self.thresholds = {
@@ -93,6 +97,7 @@ class SystemHealthMonitor:
         while self.monitoring:
             try:
                 health_status = await self.check_system_health()
+                self._snapshot = (time.monotonic(), health_status)
                 self.health_history.append(health_status)
                 
                 # Keep only last 100 health checks
@@ -114,42 +119,73 @@ class SystemHealthMonitor:
         self.monitoring = False
         PrintStyle(font_color="yellow").print("🏥 System Health Monitor: STOPPED")
     
+    async def get_health_snapshot(self, max_age: float = 3.0) -> SystemHealthStatus:
+        """Recent health status, probing only when the last one is older than max_age
+        seconds; concurrent callers on the same loop share a single probe"""
+        
+        checked_at, snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - checked_at < max_age:
+            return snapshot
+        
+        task = self._snapshot_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._snapshot_task = asyncio.ensure_future(self.check_system_health())
+        
+        health_status = await asyncio.shield(task)
+        self._snapshot = (time.monotonic(), health_status)
+        return health_status
+    
     async def check_system_health(self) -> SystemHealthStatus:
         """Perform comprehensive system health check"""
         
-        # Get system metrics
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        # The probes block (cpu_percent samples for a full second), so they run in
+        # worker threads concurrently and the check takes as long as the slowest one;
+        # a failing probe is reported as a warning instead of failing the whole check
+        results = await asyncio.gather(
+            asyncio.to_thread(psutil.cpu_percent, interval=1),
+            asyncio.to_thread(lambda: psutil.virtual_memory().percent),
+            asyncio.to_thread(lambda: psutil.disk_usage('/').percent),
+            asyncio.to_thread(self._count_python_processes),
+            self._collect_system_issues(),
+            return_exceptions=True
+        )
         
-        # Count active Python processes (Pareng Boyong related)
-        active_processes = len([p for p in psutil.process_iter(['name']) 
-                              if 'python' in p.info['name'].lower()])
+        probe_failures = []
+        def probe_result(index: int, name: str, default):
+            result = results[index]
+            if isinstance(result, Exception):
+                probe_failures.append(f"{name} probe failed: {result}")
+                return default
+            return result
+        
+        cpu_usage = probe_result(0, "CPU", 0.0)
+        memory_percent = probe_result(1, "Memory", 0.0)
+        disk_percent = probe_result(2, "Disk", 0.0)
+        active_processes = probe_result(3, "Process", 0)
+        critical_errors, warnings = probe_result(4, "System issues", ([], []))
+        warnings = warnings + probe_failures
         
         # Calculate error rate from recent health checks
         error_rate = self._calculate_error_rate()
         
         # Calculate overall health score
-        health_score = self._calculate_health_score(cpu_usage, memory.percent, disk.percent, error_rate)
+        health_score = self._calculate_health_score(cpu_usage, memory_percent, disk_percent, error_rate)
         
         # Determine overall health status
-        overall_health = self._determine_health_status(health_score, cpu_usage, memory.percent, error_rate)
-        
-        # Collect current errors and warnings
-        critical_errors, warnings = await self._collect_system_issues()
+        overall_health = self._determine_health_status(health_score, cpu_usage, memory_percent, error_rate)
         
         return SystemHealthStatus(
             timestamp=datetime.now().isoformat(),
             overall_health=overall_health,
             cpu_usage=cpu_usage,
-            memory_usage=memory.percent,
-            disk_usage=disk.percent,
+            memory_usage=memory_percent,
+            disk_usage=disk_percent,
             active_processes=active_processes,
             error_rate=error_rate,
             last_successful_operation=self._get_last_successful_operation(),
             critical_errors=critical_errors,
             warnings=warnings,
-            uptime_seconds=time.time() - self.start_time,
+            uptime_seconds=time.monotonic() - self.start_time,
             health_score=health_score
         )
     
@@ -200,9 +236,18 @@ class SystemHealthMonitor:
         else:
             return "fair"
     
+    def _count_python_processes(self) -> int:
+        """Count active Python processes (Pareng Boyong related)"""
+        return sum(1 for p in psutil.process_iter(['name'])
+                   if 'python' in (p.info['name'] or '').lower())
+    
     async def _collect_system_issues(self) -> tuple[List[str], List[str]]:
         """Collect current system errors and warnings"""
         
+        # Process scan, disk stat and log tail all block
+        return await asyncio.to_thread(self._collect_system_issues_blocking)
+    
+    def _collect_system_issues_blocking(self) -> tuple[List[str], List[str]]:
         critical_errors = []
         warnings = []
         
@@ -300,7 +345,7 @@ class ExternalAIHealer:
         """Request healing assistance from external AI"""
         
         request = ExternalAIRequest(
-            request_id=f"heal_{int(time.time())}",
+            request_id=f"heal_{time.time_ns()}",
             timestamp=datetime.now().isoformat(),
             ai_service=self._select_best_ai_service(),
             failure_context=failure,
@@ -462,19 +507,43 @@ class ExternalAIHealer:
             "echo 'Emergency healing completed'"
         ]
 
+# Healing attempts kept in memory; totals below count every attempt since start
+HEALING_HISTORY_SIZE = 1024
+
+# History entry as listed by the self-healing tool, rendered once when recorded
+_ATTEMPT_SUMMARY_TEMPLATE = (
+    "• {emoji} {timestamp}\n"
+    "  AI Service: {ai_service}\n"
+    "  Success Rate: {success_rate:.1%}\n"
+    "  Duration: {duration_seconds:.1f}s\n\n"
+)
+
 class AutomatedHealer:
     """Executes healing commands and restores system to operational status"""
     
     def __init__(self, logger: Log):
         self.logger = logger
-        self.healing_history = []
+        self.healing_history: deque = deque(maxlen=HEALING_HISTORY_SIZE)
+        self.total_attempts = 0
+        self.successful_attempts = 0
+    
+    def record_attempt(self, healing_record: Dict[str, Any]):
+        """Append a healing attempt and update the running totals"""
+        healing_record['summary'] = _ATTEMPT_SUMMARY_TEMPLATE.format(
+            emoji="✅" if healing_record['healing_successful'] else "❌",
+            **healing_record
+        )
+        self.healing_history.append(healing_record)
+        self.total_attempts += 1
+        if healing_record['healing_successful']:
+            self.successful_attempts += 1
         
     async def execute_healing_plan(self, ai_request: ExternalAIRequest) -> bool:
         """Execute the healing plan provided by external AI"""
         
         PrintStyle(font_color="cyan").print("🏥 Executing AI healing plan...")
         
-        healing_start_time = time.time()
+        healing_start_time = time.monotonic()
         successful_commands = 0
         failed_commands = 0
         
@@ -512,7 +581,7 @@ class AutomatedHealer:
                 failed_commands += 1
                 PrintStyle(font_color="red").print(f"       💥 Execution error: {e}")
         
-        healing_duration = time.time() - healing_start_time
+        healing_duration = time.monotonic() - healing_start_time
         success_rate = successful_commands / (successful_commands + failed_commands) if (successful_commands + failed_commands) > 0 else 0
         
         # Record healing attempt
@@ -528,7 +597,7 @@ class AutomatedHealer:
             'healing_successful': success_rate > 0.7
         }
         
-        self.healing_history.append(healing_record)
+        self.record_attempt(healing_record)
         
         # Report results
         if success_rate > 0.8:
@@ -578,6 +647,9 @@ class AutomatedHealer:
         
         return restoration_success
 
+# Pending healing requests beyond this are rejected rather than piling up
+HEALING_QUEUE_SIZE = 4
+
 class ParengBoyongSelfHealingSystem:
     """Main self-healing system orchestrator"""
     
@@ -594,6 +666,14 @@ class ParengBoyongSelfHealingSystem:
         self.healing_in_progress = False
         self.monitoring_task = None
         
+        # Single supervised worker that owns monitoring and runs queued healing
+        # requests one at a time; strong references keep background tasks alive
+        self.supervisor_task: Optional[asyncio.Task] = None
+        self._healing_queue: Optional[asyncio.Queue] = None
+        self._background_tasks: set[asyncio.Task] = set()
+        # Held while a sequence runs so concurrent triggers are turned away
+        self._healing_lock = asyncio.Lock()
+        
         # Self-healing settings
         self.settings = {
             'auto_healing_enabled': True,
@@ -612,6 +692,8 @@ class ParengBoyongSelfHealingSystem:
         PrintStyle(font_color="cyan").print("   • External AI healing: ENABLED")
         PrintStyle(font_color="cyan").print("   • Automated recovery: READY")
         
+        self.enabled = True
+        
         # Start health monitoring
         self.monitoring_task = asyncio.create_task(self._monitor_and_heal())
         
@@ -625,9 +707,84 @@ class ParengBoyongSelfHealingSystem:
         
         if self.monitoring_task:
             self.monitoring_task.cancel()
+        
+        if self.supervisor_task:
+            self.supervisor_task.cancel()
+            self.supervisor_task = None
             
         PrintStyle(font_color="yellow").print("🤖 Self-healing system: STOPPED")
     
+    def start_background(self) -> bool:
+        """Start the supervised self-healing worker, False if it is already running"""
+        
+        if self.supervisor_task and not self.supervisor_task.done():
+            return False
+        
+        self._healing_queue = asyncio.Queue(maxsize=HEALING_QUEUE_SIZE)
+        self.supervisor_task = asyncio.create_task(self._healing_worker())
+        self.supervisor_task.add_done_callback(self._on_supervisor_done)
+        return True
+    
+    async def request_healing(self, health_status: SystemHealthStatus, wait: bool = False) -> bool:
+        """Run a healing sequence through the worker queue; returns False when a
+        sequence is already running or waiting, since a second one would only
+        repeat it. Without a worker on this event loop the sequence runs directly."""
+        
+        if self.healing_in_progress or self._healing_lock.locked():
+            return False
+        
+        worker = self.supervisor_task
+        if not worker or worker.done() or worker.get_loop() is not asyncio.get_running_loop():
+            async with self._healing_lock:
+                await self._initiate_healing_sequence(health_status)
+            return True
+        
+        if not self._healing_queue.empty():
+            return False
+        
+        done = asyncio.get_running_loop().create_future()
+        try:
+            self._healing_queue.put_nowait((health_status, done))
+        except asyncio.QueueFull:
+            return False
+        
+        if wait:
+            await done
+        return True
+    
+    async def _healing_worker(self):
+        """Start monitoring, then run queued healing requests one at a time"""
+        
+        await self.start_self_healing_system()
+        
+        while True:
+            health_status, done = await self._healing_queue.get()
+            try:
+                async with self._healing_lock:
+                    await self._initiate_healing_sequence(health_status)
+                if not done.done():
+                    done.set_result(None)
+            except Exception as e:
+                if not done.done():
+                    done.set_exception(e)
+            finally:
+                self._healing_queue.task_done()
+    
+    def _on_supervisor_done(self, task: asyncio.Task):
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error:
+            PrintStyle.error(f"Self-healing worker crashed: {error}")
+            self.logger.log(type="error", content=f"Self-healing worker crashed: {error}")
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Create a background task and hold a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
     async def _monitor_and_heal(self):
         """Main monitoring and healing loop"""
         
@@ -685,7 +842,7 @@ class ParengBoyongSelfHealingSystem:
             
             # Create critical failure record
             failure = CriticalFailure(
-                failure_id=f"critical_{int(time.time())}",
+                failure_id=f"critical_{time.time_ns()}",
                 timestamp=datetime.now().isoformat(),
                 failure_type="system_critical",
                 description=f"System health critical: score {health_status.health_score:.2f}",
@@ -724,7 +881,7 @@ class ParengBoyongSelfHealingSystem:
                     PrintStyle(font_color="green").print("   Pareng Boyong has been restored to operational status")
                     
                     # Start extended monitoring
-                    asyncio.create_task(self._post_healing_monitoring(failure.failure_id))
+                    self._spawn(self._post_healing_monitoring(failure.failure_id))
                     
                 else:
                     failure.resolution_status = "failed"
@@ -744,9 +901,9 @@ class ParengBoyongSelfHealingSystem:
         PrintStyle(font_color="cyan").print("🔍 Starting post-healing stability monitoring...")
         
         monitoring_duration = self.settings['post_healing_monitoring_minutes'] * 60  # Convert to seconds
-        monitoring_start = time.time()
+        monitoring_start = time.monotonic()
         
-        while (time.time() - monitoring_start) < monitoring_duration:
+        while (time.monotonic() - monitoring_start) < monitoring_duration:
             health_status = await self.health_monitor.check_system_health()
             
             if health_status.overall_health in ["healthy", "fair"]:
@@ -770,7 +927,7 @@ class ParengBoyongSelfHealingSystem:
             'external_ai_enabled': self.settings['enable_external_ai'],
             'health_monitor_active': self.health_monitor.monitoring,
             'recent_health_checks': len(self.health_monitor.health_history),
-            'healing_attempts': len(self.automated_healer.healing_history),
+            'healing_attempts': self.automated_healer.total_attempts,
             'last_health_score': self.health_monitor.health_history[-1].health_score if self.health_monitor.health_history else 0.0,
             'settings': self.settings
         }
@@ -8,6 +8,37 @@ from typing import Optional, Dict, Any
 from python.helpers.tool import Tool, Response
 from python.helpers.print_style import PrintStyle
 
+_STATUS = PrintStyle(font_color="green", padding=False)
+
+# Maps underscores to spaces for display labels
+_UND2SP = str.maketrans("_", " ")
+
+# Success message up to the opening <audio> tag; the payload is appended separately
+_MSG_TMPL = (
+    "🎵 **{type_label} Generated Successfully!**\n\n"
+    "**Prompt:** {prompt}\n"
+    "**Duration:** {duration} seconds\n"
+    "**Type:** {type_label}\n"
+    "{metadata}\n\n"
+    '<audio format="wav" title="{title}">'
+)
+
+# Type-specific prompt enhancements
+_TYPE_ENHANCEMENTS = {
+    "sound_effect": "realistic sound effect",
+    "ambient": "ambient background sound, looping",
+    "jingle": "short musical jingle, catchy",
+    "loop": "seamless loop, repetitive",
+}
+
+# Tempo characteristics
+_TEMPO_DESCRIPTIONS = {
+    "slow": "slow tempo, relaxed pace",
+    "medium": "moderate tempo",
+    "fast": "fast tempo, energetic pace",
+    "variable": "variable tempo, dynamic pacing",
+}
+
 class MusicGenerator(Tool):
     async def execute(self, **kwargs) -> Response:
         """Execute music generation"""
@@ -25,7 +56,7 @@ class MusicGenerator(Tool):
             return Response(message="❌ Please provide a description for the music to generate.", break_loop=False)
         
         try:
-            PrintStyle(font_color="green", padding=False).print(f"🎵 Generating {audio_type}: {prompt[:50]}...")
+            _STATUS.print(f"🎵 Generating {audio_type}: {prompt[:50]}...")
             
             # Build enhanced prompt
             enhanced_prompt = self._build_enhanced_prompt(
@@ -52,7 +83,7 @@ class MusicGenerator(Tool):
             # Build response with metadata
             metadata_lines = []
             if genre != "any":
-                metadata_lines.append(f"**Genre:** {genre.replace('_', ' ').title()}")
+                metadata_lines.append(f"**Genre:** {genre.translate(_UND2SP).title()}")
             if mood != "any":
                 metadata_lines.append(f"**Mood:** {mood.title()}")
             if tempo != "medium":
@@ -61,16 +92,18 @@ class MusicGenerator(Tool):
                 metadata_lines.append(f"**Instruments:** {instruments}")
             
             metadata = "\n".join(metadata_lines) if metadata_lines else ""
+            type_label = audio_type.translate(_UND2SP).title()
             
+            # Keep the (potentially MB-scale) base64 payload out of the template
+            header = _MSG_TMPL.format(
+                type_label=type_label,
+                prompt=prompt,
+                duration=duration,
+                metadata=metadata,
+                title=title,
+            )
             return Response(
-                message=f"""🎵 **{audio_type.replace('_', ' ').title()} Generated Successfully!**
-
-**Prompt:** {prompt}
-**Duration:** {duration} seconds
-**Type:** {audio_type.replace('_', ' ').title()}
-{metadata}
-
-<audio format="wav" title="{title}">{audio_base64}</audio>""",
+                message="".join((header, audio_base64, "</audio>")),
                 break_loop=False
             )
                 
@@ -159,44 +192,19 @@ class MusicGenerator(Tool):
     ) -> str:
         """Build enhanced prompt with additional specifications"""
         
-        enhancements = []
-        
-        # Add type-specific enhancements
-        if audio_type == "sound_effect":
-            enhancements.append("realistic sound effect")
-        elif audio_type == "ambient":
-            enhancements.append("ambient background sound, looping")
-        elif audio_type == "jingle":
-            enhancements.append("short musical jingle, catchy")
-        elif audio_type == "loop":
-            enhancements.append("seamless loop, repetitive")
-        
-        # Add genre if specified
-        if genre != "any":
-            enhancements.append(f"{genre.replace('_', ' ')} style")
-        
-        # Add mood if specified
-        if mood != "any":
-            enhancements.append(f"{mood} mood")
-        
-        # Add tempo characteristics
-        tempo_descriptions = {
-            "slow": "slow tempo, relaxed pace",
-            "medium": "moderate tempo",
-            "fast": "fast tempo, energetic pace",
-            "variable": "variable tempo, dynamic pacing"
-        }
-        if tempo in tempo_descriptions:
-            enhancements.append(tempo_descriptions[tempo])
-        
-        # Add instruments if specified
-        if instruments:
-            enhancements.append(f"featuring {instruments}")
+        parts = (
+            part for part in (
+                _TYPE_ENHANCEMENTS.get(audio_type),
+                f"{genre.translate(_UND2SP)} style" if genre != "any" else None,
+                f"{mood} mood" if mood != "any" else None,
+                _TEMPO_DESCRIPTIONS.get(tempo),
+                f"featuring {instruments}" if instruments else None,
+            ) if part
+        )
         
         # Combine with original prompt
-        if enhancements:
-            return f"{prompt}, {', '.join(enhancements)}"
-        return prompt
+        enhancements = ", ".join(parts)
+        return f"{prompt}, {enhancements}" if enhancements else prompt
 
 # Register the tool
 def register():
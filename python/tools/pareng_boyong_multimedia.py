@@ -7,23 +7,67 @@ import requests
 import json
 import os
 import datetime
+import functools
+import re
+from collections import OrderedDict
 from pathlib import Path
 
+# Deliverables locations, parsed once instead of on every generation call
+_IMG_DIR = Path("/root/projects/pareng-boyong/pareng_boyong_deliverables/images")
+_VID_DIR = Path("/root/projects/pareng-boyong/pareng_boyong_deliverables/videos")
+_ACCESS_PREFIX_IMG = "/pareng_boyong_deliverables/images/"
+_ACCESS_PREFIX_VID = "/pareng_boyong_deliverables/videos/"
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path):
+    """Create a deliverables directory once per process and return it"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+# Multimedia request keyword stems shared by the auto-generator and the detector.
+# Stems are matched at the start of a word, so inflections and compounds
+# ("photography", "drawings", "generated", "photo's") are still detected.
+_IMAGE_RE = re.compile(r"\b(?:imag|pictur|photo|draw|creat|generat|larawan|gumawa)")
+_VIDEO_RE = re.compile(r"\b(?:video|animat|movie|clip|pelikula)")
+_AUDIO_RE = re.compile(r"\b(?:music|sound|voice|audio|tunog|musika)")
+_DETECTION_RES = (("image", _IMAGE_RE), ("video", _VIDEO_RE), ("audio", _AUDIO_RE))
+
+# Bounded LRU caches of successful generations, keyed by request parameters
+_CACHE_MAXSIZE = 64
+_IMG_CACHE = OrderedDict()
+_VID_CACHE = OrderedDict()
+
+def _cache_get(cache, key):
+    """Return a cached result if its file is still on disk, else None"""
+    result = cache.get(key)
+    if result is None:
+        return None
+    if not os.path.exists(result["file_path"]):
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return {**result, "cache": "hit"}
+
+def _cache_put(cache, key, result):
+    """Store a successful result, evicting the least recently used entry"""
+    if result and result.get("status") == "success" and result.get("file_path"):
+        cache[key] = result
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_MAXSIZE:
+            cache.popitem(last=False)
+    return result
+
 def multimedia_auto_generator(user_message):
     """
     Auto-detect and generate multimedia content from user messages
     """
     try:
-        # Simple pattern matching for multimedia requests
+        # Simple keyword matching for multimedia requests
         message = user_message.lower()
         
-        # Image detection patterns
-        image_patterns = ['image', 'picture', 'photo', 'draw', 'create', 'generate', 'larawan', 'gumawa']
-        video_patterns = ['video', 'animation', 'movie', 'clip', 'animate', 'pelikula']
-        
-        if any(pattern in message for pattern in image_patterns):
+        if _IMAGE_RE.search(message):
             return multimedia_image_generator(user_message)
-        elif any(pattern in message for pattern in video_patterns):
+        elif _VIDEO_RE.search(message):
             return multimedia_video_generator(user_message)
         
         return None
@@ -34,10 +78,16 @@ def multimedia_image_generator(prompt, category="general", width=1024, height=10
     """
     Generate images using Pollinations.AI
     """
+    key = (prompt, category, width, height)
+    cached = _cache_get(_IMG_CACHE, key)
+    if cached is not None:
+        return cached
+    return _cache_put(_IMG_CACHE, key, _generate_image(prompt, category, width, height))
+
+def _generate_image(prompt, category, width, height):
     try:
         # Create deliverables directory
-        base_dir = Path("/root/projects/pareng-boyong/pareng_boyong_deliverables/images")
-        base_dir.mkdir(parents=True, exist_ok=True)
+        base_dir = _ensure_dir(_IMG_DIR)
         
         # Generate unique filename
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -59,7 +109,7 @@ def multimedia_image_generator(prompt, category="general", width=1024, height=10
                 return {
                     "status": "success",
                     "file_path": str(file_path),
-                    "access_url": f"/pareng_boyong_deliverables/images/{filename}",
+                    "access_url": _ACCESS_PREFIX_IMG + filename,
                     "metadata": {
                         "prompt": prompt,
                         "category": category,
@@ -84,7 +134,7 @@ def multimedia_image_generator(prompt, category="general", width=1024, height=10
                 return {
                     "status": "success",
                     "file_path": str(file_path),
-                    "access_url": f"/pareng_boyong_deliverables/images/{filename}",
+                    "access_url": _ACCESS_PREFIX_IMG + filename,
                     "metadata": {
                         "prompt": prompt,
                         "category": category,
@@ -100,10 +150,16 @@ def multimedia_video_generator(prompt, category="general", duration=6):
     """
     Generate videos using available video services
     """
+    key = (prompt, category, duration)
+    cached = _cache_get(_VID_CACHE, key)
+    if cached is not None:
+        return cached
+    return _cache_put(_VID_CACHE, key, _generate_video(prompt, category, duration))
+
+def _generate_video(prompt, category, duration):
     try:
         # Create deliverables directory
-        base_dir = Path("/root/projects/pareng-boyong/pareng_boyong_deliverables/videos")
-        base_dir.mkdir(parents=True, exist_ok=True)
+        base_dir = _ensure_dir(_VID_DIR)
         
         # Generate unique filename
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -125,7 +181,7 @@ def multimedia_video_generator(prompt, category="general", duration=6):
                 return {
                     "status": "success",
                     "file_path": str(file_path),
-                    "access_url": f"/pareng_boyong_deliverables/videos/{filename}",
+                    "access_url": _ACCESS_PREFIX_VID + filename,
                     "metadata": {
                         "prompt": prompt,
                         "category": category,
@@ -178,18 +234,11 @@ def multimedia_request_detector(user_message):
     """
     message = user_message.lower()
     
-    # Detection patterns
-    patterns = {
-        "image": ["image", "picture", "photo", "draw", "create", "generate", "larawan", "gumawa"],
-        "video": ["video", "animation", "movie", "clip", "animate", "pelikula"],
-        "audio": ["music", "sound", "voice", "audio", "tunog", "musika"]
-    }
-    
     detected = []
     confidence = 0
     
-    for media_type, keywords in patterns.items():
-        if any(keyword in message for keyword in keywords):
+    for media_type, keyword_re in _DETECTION_RES:
+        if keyword_re.search(message):
             detected.append(media_type)
             confidence += 0.3
     
@@ -4,6 +4,8 @@ This file provides seamless multimedia generation capabilities for Agent Zero
 bypassing Docker daemon restrictions through host network access
 """
 
+import re
+
 try:
     from .multimedia_service_integration import (
         generate_multimedia_content,
@@ -29,6 +31,15 @@ except ImportError:
         host_get_localai_models
     )
 
+# Single-pass prefilter for multimedia_auto_generator: every image/video keyword
+# used by analyze_multimedia_request contains one of these stems, so a message
+# without any of them can never resolve to an image or video request.
+_GENERATION_HINT_RE = re.compile(
+    "image|picture|photo|artwork|illustration|visual|portrait|landscape|draw|design"
+    "|larawan|litrato|video|animat|clip|movie|film|cinematic",
+    re.IGNORECASE,
+)
+
 # Main multimedia generation tools for Agent Zero
 def multimedia_image_generator(prompt, category=None, width=1024, height=1024):
     """
@@ -120,6 +131,12 @@ def multimedia_auto_generator(message, threshold=0.7):
         if result and result["status"] == "success":
             print(f"Auto-generated: {result['file_path']}")
     """
+    # Fast path for ordinary chat turns
+    if len(message) < 4 or not any(c.isalpha() for c in message):
+        return None
+    if not _GENERATION_HINT_RE.search(message):
+        return None
+    
     analysis = analyze_multimedia_request(message)
     if analysis["should_activate"] and analysis["overall_confidence"] >= threshold:
         primary_type = analysis["primary_type"]
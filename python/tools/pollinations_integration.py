@@ -4,21 +4,255 @@ Provides access to Pollinations.AI Docker container for image generation
 """
 
 import asyncio
-import os
-import base64
-from typing import Optional, Dict, Any
+import datetime
+import hashlib
+import json
+import re
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
 from python.helpers.tool import Tool, Response
 from python.helpers.print_style import PrintStyle
-from python.helpers.docker_multimedia_client import DockerMultimediaClient
-from python.helpers.files import create_folder, write_file
+from python.helpers.docker_multimedia_client import DockerMultimediaClient, GeneratedImage, get_docker_client
+
+_INFO = PrintStyle(font_color="cyan")
+
+_DELIVERABLES_PATH = "/root/projects/pareng-boyong/pareng_boyong_deliverables"
+_IMAGES_DIR = Path(_DELIVERABLES_PATH) / "images"
+
+# Folders already created by this process
+_created_dirs: set = set()
+_created_dirs_lock = threading.Lock()
+
+def _ensure_dirs(*dirs: Path):
+    """Create the given folders, skipping any this process has already created"""
+    with _created_dirs_lock:
+        for path in dirs:
+            if path not in _created_dirs:
+                path.mkdir(parents=True, exist_ok=True)
+                _created_dirs.add(path)
+
+def _write_bytes(path: Path, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+
+# Prompt keywords per storage category, in priority order
+_CATEGORY_KEYWORDS = {
+    'portraits': frozenset({'portrait', 'headshot', 'person', 'face', 'human', 'character', 'selfie', 'avatar'}),
+    'landscapes': frozenset({'landscape', 'mountain', 'forest', 'beach', 'nature', 'sunset', 'sunrise', 'scenery', 'outdoor'}),
+    'artwork': frozenset({'abstract', 'artistic', 'painting', 'drawing', 'creative', 'art', 'illustration', 'design'}),
+    'product_photos': frozenset({'product', 'commercial', 'advertisement', 'marketing', 'brand', 'logo', 'business'}),
+    'social_media': frozenset({'instagram', 'facebook', 'post', 'story', 'stories', 'thumbnail', 'cover'}),
+    'educational': frozenset({'educational', 'diagram', 'infographic', 'chart', 'instruction', 'tutorial', 'learning'}),
+}
+
+# Flat word -> category lookup, plurals included
+_CATEGORY_MAP = {
+    form: category
+    for category, words in _CATEGORY_KEYWORDS.items()
+    for word in words
+    for form in (word, word + 's')
+}
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Every folder _categorize_prompt can choose
+_CATEGORY_DIRS = {name: _IMAGES_DIR / name for name in (*_CATEGORY_KEYWORDS, 'general')}
+
+# Short-lived health probe result shared by the health/status operations
+_HEALTH_TTL = 3.0
+_health_cache: Optional[Tuple[float, Dict[str, bool]]] = None
+
+async def _check_services_health(client: DockerMultimediaClient) -> Dict[str, bool]:
+    """Probe service health, reusing a result younger than _HEALTH_TTL seconds"""
+    global _health_cache
+    if _health_cache and time.monotonic() - _health_cache[0] < _HEALTH_TTL:
+        return _health_cache[1]
+    health_status = await client.check_services_health()
+    _health_cache = (time.monotonic(), health_status)
+    return health_status
+
+def _invalidate_health():
+    """Force the next health probe to hit the services"""
+    global _health_cache
+    _health_cache = None
+
+# Seeded generations are deterministic, so identical requests reuse earlier images:
+# a small in-memory LRU, backed by an sqlite index mapping each request to the
+# image already saved in the deliverables folder
+_IMAGE_CACHE_MAXSIZE = 32
+_IMAGE_INDEX_PATH = _IMAGES_DIR / ".cache" / "image_index.sqlite"
+_image_cache: "OrderedDict[str, Tuple[GeneratedImage, Optional[str]]]" = OrderedDict()
+
+def _image_cache_key(prompt: str, width: int, height: int, style: str, seed: int) -> str:
+    raw = f"{prompt}|{width}|{height}|{style}|{seed}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+def _image_cache_remember(key: str, image: GeneratedImage, path: Optional[str]):
+    _image_cache[key] = (image, path)
+    _image_cache.move_to_end(key)
+    if len(_image_cache) > _IMAGE_CACHE_MAXSIZE:
+        _image_cache.popitem(last=False)
+
+def _image_index_connect() -> sqlite3.Connection:
+    _ensure_dirs(_IMAGE_INDEX_PATH.parent)
+    conn = sqlite3.connect(_IMAGE_INDEX_PATH, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS idx (key TEXT PRIMARY KEY, path TEXT, ts INTEGER)")
+    return conn
+
+def _read_indexed_image(key: str) -> Optional[Tuple[bytes, str]]:
+    """Bytes and path of the saved image for a request key, if the file still exists"""
+    try:
+        conn = _image_index_connect()
+        try:
+            row = conn.execute("SELECT path FROM idx WHERE key=?", (key,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        with open(row[0], "rb") as f:
+            return f.read(), row[0]
+    except (sqlite3.Error, OSError):
+        return None
+
+def _index_saved_image(key: str, path: str):
+    try:
+        conn = _image_index_connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO idx (key, path, ts) VALUES (?, ?, ?)",
+                    (key, path, int(time.time()))
+                )
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        # The index is only an optimization, a failed write just means no reuse
+        pass
+
+async def _image_cache_get(key: str) -> Optional[Tuple[GeneratedImage, Optional[str]]]:
+    """Cached image and the path it was saved to (None if unsaved or since deleted)"""
+    cached = _image_cache.get(key)
+    if cached is not None:
+        _image_cache.move_to_end(key)
+        image, path = cached
+        if path is not None and not await asyncio.to_thread(Path(path).is_file):
+            path = None
+        return image, path
+    indexed = await asyncio.to_thread(_read_indexed_image, key)
+    if indexed is None:
+        return None
+    data, path = indexed
+    image = GeneratedImage.from_bytes(data)
+    _image_cache_remember(key, image, path)
+    return image, path
+
+async def _image_cache_put(key: str, image: GeneratedImage, path: Optional[str]):
+    _image_cache_remember(key, image, path)
+    if path is not None:
+        await asyncio.to_thread(_index_saved_image, key, path)
+
+# Per-image fields accepted by the batch operation
+_BATCH_REQUEST_KEYS = frozenset(("prompt", "width", "height", "style", "seed"))
+
+def _normalize_image_params(width: Any, height: Any, seed: Any) -> Tuple[int, int, Optional[int]]:
+    """Dimensions as ints clamped to 256-2048 and the seed as an int, None if unusable"""
+    width = max(256, min(int(width), 2048))
+    height = max(256, min(int(height), 2048))
+    if seed is not None:
+        try:
+            seed = int(seed)
+        except (ValueError, TypeError):
+            seed = None
+    return width, height, seed
+
+def _normalize_batch_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    request = {k: v for k, v in request.items() if k in _BATCH_REQUEST_KEYS}
+    request["width"], request["height"], seed = _normalize_image_params(
+        request.get("width", 1024), request.get("height", 1024), request.get("seed")
+    )
+    if seed is None:
+        request.pop("seed", None)
+    else:
+        request["seed"] = seed
+    return request
+
+# Response templates
+_HEALTH_OK_TEMPLATE = (
+    "✅ **Pollinations.AI Service Status: HEALTHY**\n\n"
+    "🎨 **Image Generation Ready**\n"
+    "• **Service URL**: {url}\n"
+    "• **Health Endpoint**: ✅ Responding\n"
+    "• **Max Resolution**: 2048x2048 pixels\n"
+    "• **Supported Formats**: PNG (Base64)\n"
+    "• **Style Support**: ✅ Available\n"
+    "• **Seed Control**: ✅ Available\n\n"
+    "💡 **Quick Start:**\n"
+    "```\npollinations_integration operation=generate prompt=\"Your image description\"\n```"
+)
+
+_HEALTH_DOWN_MESSAGE = (
+    "❌ **Pollinations.AI Service Status: UNAVAILABLE**\n\n"
+    "🔧 **Troubleshooting:**\n"
+    "• Check Docker container: `docker ps | grep pollinations`\n"
+    "• Restart service: `docker-compose -f docker-compose.multimodal-new.yml restart pollinations`\n"
+    "• Check logs: `docker logs pareng-boyong-pollinations-1`\n"
+    "• Verify port 8091 is available\n"
+)
+
+_STATUS_ONLINE_TEMPLATE = (
+    "🎨 **Pollinations.AI Service Status Report**\n\n"
+    "✅ **Service**: Online and Ready\n"
+    "🌐 **API Endpoint**: {url}\n"
+    "🏥 **Health Check**: {endpoint}\n"
+    "🐳 **Container**: pareng-boyong-pollinations-1\n"
+    "🔌 **Port Mapping**: 8091:8081\n\n"
+    "⚙️ **Capabilities:**\n"
+    "• **Image Generation**: Text-to-Image\n"
+    "• **Resolution Range**: 256x256 to 2048x2048\n"
+    "• **Style Modifiers**: Photography, art, cartoon, etc.\n"
+    "• **Seed Support**: Reproducible generation\n"
+    "• **Format Output**: PNG (Base64 encoded)\n\n"
+    "🎯 **Usage Examples:**\n"
+    "• Simple: `operation=generate prompt=\"Beautiful landscape\"`\n"
+    "• Styled: `prompt=\"Portrait\" style=\"professional photography\"`\n"
+    "• Custom size: `prompt=\"Logo\" width=512 height=512`\n"
+    "• Reproducible: `prompt=\"Art\" seed=12345`\n"
+)
+
+_STATUS_OFFLINE_MESSAGE = (
+    "🎨 **Pollinations.AI Service Status Report**\n\n"
+    "❌ **Service**: Offline\n"
+    "🔧 **Issue**: Container not responding\n"
+    "📋 **Recovery Steps**:\n"
+    "1. Check container status: `docker ps | grep pollinations`\n"
+    "2. View logs: `docker logs pareng-boyong-pollinations-1`\n"
+    "3. Restart: `docker restart pareng-boyong-pollinations-1`\n"
+    "4. Full restart: `docker-compose -f docker-compose.multimodal-new.yml restart pollinations`\n"
+)
+
+_GENERATE_TIPS = (
+    "💡 **Tips for better results:**\n"
+    "• Be specific about details, colors, and composition\n"
+    "• Add style keywords like 'photorealistic', 'artistic', 'cartoon'\n"
+    "• Use lighting terms like 'golden hour', 'studio lighting'\n"
+    "• Save the seed number to recreate similar images\n"
+)
 
 class PollinationsIntegration(Tool):
     """
     Generate high-quality images using Pollinations.AI Docker service
     
     Args:
-        operation (str): Operation to perform - 'generate', 'health', 'status'
+        operation (str): Operation to perform - 'generate', 'batch', 'health', 'status'
         prompt (str): Image description for generation (required for 'generate')
+        prompts (list): Image requests for 'batch', each a prompt string or a dict
+                        with prompt and optional width, height, style, seed
+        max_parallel (int): Concurrent generations for 'batch' (default: 4)
         width (int): Image width in pixels (default: 1024, max: 2048)
         height (int): Image height in pixels (default: 1024, max: 2048)  
         style (str): Style modifier for the image (optional)
@@ -34,7 +268,7 @@ class PollinationsIntegration(Tool):
     
     def __init__(self):
         super().__init__()
-        self.deliverables_path = "/root/projects/pareng-boyong/pareng_boyong_deliverables"
+        self.deliverables_path = _DELIVERABLES_PATH
     
     async def execute(self, **kwargs) -> Response:
         """Execute Pollinations.AI integration operation"""
@@ -42,19 +276,21 @@ class PollinationsIntegration(Tool):
         operation = kwargs.get("operation", "generate").lower()
         
         try:
-            async with DockerMultimediaClient() as client:
-                
-                if operation == "health":
-                    return await self._check_health(client)
-                elif operation == "status":
-                    return await self._get_status(client)
-                elif operation == "generate":
-                    return await self._generate_image(client, kwargs)
-                else:
-                    return Response(
-                        message=f"❌ Unknown operation '{operation}'. Available: health, status, generate",
-                        break_loop=False
-                    )
+            client = await get_docker_client()
+            
+            if operation == "health":
+                return await self._check_health(client)
+            elif operation == "status":
+                return await self._get_status(client)
+            elif operation == "generate":
+                return await self._generate_image(client, kwargs)
+            elif operation == "batch":
+                return await self._generate_batch_images(client, kwargs)
+            else:
+                return Response(
+                    message=f"❌ Unknown operation '{operation}'. Available: health, status, generate, batch",
+                    break_loop=False
+                )
                     
         except Exception as e:
             PrintStyle.error(f"Pollinations integration error: {e}")
@@ -66,69 +302,31 @@ class PollinationsIntegration(Tool):
     async def _check_health(self, client: DockerMultimediaClient) -> Response:
         """Check Pollinations.AI service health"""
         
-        health_status = await client.check_services_health()
+        health_status = await _check_services_health(client)
         pollinations_healthy = health_status.get('pollinations', False)
         
         if pollinations_healthy:
-            message = f"✅ **Pollinations.AI Service Status: HEALTHY**\n\n"
-            message += f"🎨 **Image Generation Ready**\n"
-            message += f"• **Service URL**: {client.services['pollinations']['url']}\n"
-            message += f"• **Health Endpoint**: ✅ Responding\n"
-            message += f"• **Max Resolution**: 2048x2048 pixels\n"
-            message += f"• **Supported Formats**: PNG (Base64)\n"
-            message += f"• **Style Support**: ✅ Available\n"
-            message += f"• **Seed Control**: ✅ Available\n\n"
-            
-            message += f"💡 **Quick Start:**\n"
-            message += f"```\npollinations_integration operation=generate prompt=\"Your image description\"\n```"
-            
-            return Response(message=message, break_loop=False)
+            message = _HEALTH_OK_TEMPLATE.format(url=client.services['pollinations']['url'])
         else:
-            message = f"❌ **Pollinations.AI Service Status: UNAVAILABLE**\n\n"
-            message += f"🔧 **Troubleshooting:**\n"
-            message += f"• Check Docker container: `docker ps | grep pollinations`\n"
-            message += f"• Restart service: `docker-compose -f docker-compose.multimodal-new.yml restart pollinations`\n"
-            message += f"• Check logs: `docker logs pareng-boyong-pollinations-1`\n"
-            message += f"• Verify port 8091 is available\n"
-            
-            return Response(message=message, break_loop=False)
+            message = _HEALTH_DOWN_MESSAGE
+        
+        return Response(message=message, break_loop=False)
     
     async def _get_status(self, client: DockerMultimediaClient) -> Response:
         """Get detailed Pollinations.AI status information"""
         
+        # The shared client outlives a single call, so refresh availability first
+        await _check_services_health(client)
         status = client.get_service_status()
         pollinations_status = status.get('pollinations', {})
         
-        message = f"🎨 **Pollinations.AI Service Status Report**\n\n"
-        
         if pollinations_status.get('available'):
-            message += f"✅ **Service**: Online and Ready\n"
-            message += f"🌐 **API Endpoint**: {pollinations_status['url']}\n"
-            message += f"🏥 **Health Check**: {pollinations_status['endpoint']}\n"
-            message += f"🐳 **Container**: pareng-boyong-pollinations-1\n"
-            message += f"🔌 **Port Mapping**: 8091:8081\n\n"
-            
-            message += f"⚙️ **Capabilities:**\n"
-            message += f"• **Image Generation**: Text-to-Image\n"
-            message += f"• **Resolution Range**: 256x256 to 2048x2048\n"
-            message += f"• **Style Modifiers**: Photography, art, cartoon, etc.\n"
-            message += f"• **Seed Support**: Reproducible generation\n"
-            message += f"• **Format Output**: PNG (Base64 encoded)\n\n"
-            
-            message += f"🎯 **Usage Examples:**\n"
-            message += f"• Simple: `operation=generate prompt=\"Beautiful landscape\"`\n"
-            message += f"• Styled: `prompt=\"Portrait\" style=\"professional photography\"`\n"
-            message += f"• Custom size: `prompt=\"Logo\" width=512 height=512`\n"
-            message += f"• Reproducible: `prompt=\"Art\" seed=12345`\n"
-            
+            message = _STATUS_ONLINE_TEMPLATE.format(
+                url=pollinations_status['url'],
+                endpoint=pollinations_status['endpoint'],
+            )
         else:
-            message += f"❌ **Service**: Offline\n"
-            message += f"🔧 **Issue**: Container not responding\n"
-            message += f"📋 **Recovery Steps**:\n"
-            message += f"1. Check container status: `docker ps | grep pollinations`\n"
-            message += f"2. View logs: `docker logs pareng-boyong-pollinations-1`\n"
-            message += f"3. Restart: `docker restart pareng-boyong-pollinations-1`\n"
-            message += f"4. Full restart: `docker-compose -f docker-compose.multimodal-new.yml restart pollinations`\n"
+            message = _STATUS_OFFLINE_MESSAGE
         
         return Response(message=message, break_loop=False)
     
@@ -142,6 +340,10 @@ class PollinationsIntegration(Tool):
                 break_loop=False
             )
         
+        # Re-probe before giving up, the shared client may hold a stale result
+        if not client.is_service_available('pollinations'):
+            _invalidate_health()
+            await _check_services_health(client)
         if not client.is_service_available('pollinations'):
             return Response(
                 message="❌ Pollinations.AI service is not available. Use 'pollinations_integration operation=health' to check status.",
@@ -149,130 +351,187 @@ class PollinationsIntegration(Tool):
             )
         
         # Parse parameters with validation
-        width = int(kwargs.get("width", 1024))
-        height = int(kwargs.get("height", 1024))
+        width, height, seed = _normalize_image_params(
+            kwargs.get("width", 1024), kwargs.get("height", 1024), kwargs.get("seed")
+        )
         style = kwargs.get("style", "").strip()
-        seed = kwargs.get("seed")
         save_to_file = kwargs.get("save_to_file", True)
         
-        # Validate dimensions
-        width = max(256, min(width, 2048))
-        height = max(256, min(height, 2048))
-        
-        # Convert seed to int if provided
-        if seed is not None:
-            try:
-                seed = int(seed)
-            except (ValueError, TypeError):
-                seed = None
-        
-        PrintStyle(font_color="cyan").print(f"🎨 Generating image with Pollinations.AI...")
-        PrintStyle(font_color="white", background_color="magenta", padding=True).print(f"Prompt: {prompt}")
-        
+        lines = ["🎨 Generating image with Pollinations.AI...", f"Prompt: {prompt}"]
         if style:
-            PrintStyle(font_color="cyan").print(f"🎭 Style: {style}")
+            lines.append(f"🎭 Style: {style}")
         if seed is not None:
-            PrintStyle(font_color="cyan").print(f"🎲 Seed: {seed}")
-            
-        PrintStyle(font_color="cyan").print(f"📐 Dimensions: {width}x{height}")
-        
-        # Generate image
-        image_base64 = await client.generate_image_pollinations(
-            prompt=prompt,
-            width=width,
-            height=height,
-            style=style,
-            seed=seed
-        )
-        
-        if not image_base64:
-            return Response(
-                message="❌ Failed to generate image with Pollinations.AI. Check service logs for details.",
-                break_loop=False
+            lines.append(f"🎲 Seed: {seed}")
+        lines.append(f"📐 Dimensions: {width}x{height}")
+        _INFO.print("\n".join(lines))
+        
+        # Reuse an earlier result for an identical seeded request, unseeded ones are random
+        cache_key = _image_cache_key(prompt, width, height, style, seed) if seed is not None else None
+        cached = await _image_cache_get(cache_key) if cache_key else None
+        
+        saved_path = None
+        if cached:
+            image, saved_path = cached
+            _INFO.print("♻️ Image cache hit, skipping generation")
+        else:
+            # Generate image
+            image = await client.generate_image_pollinations_result(
+                prompt=prompt,
+                width=width,
+                height=height,
+                style=style,
+                seed=seed
             )
-        
-        # Save to file if requested
+            
+            if not image:
+                _invalidate_health()
+                return Response(
+                    message="❌ Failed to generate image with Pollinations.AI. Check service logs for details.",
+                    break_loop=False
+                )
+        
+        # Save to file if requested, a cached image is already on disk
         file_path = None
         if save_to_file:
-            file_path = await self._save_image_to_deliverables(image_base64, prompt)
+            file_path = saved_path or await self._save_image_to_deliverables(image.data, prompt)
+        
+        if cache_key:
+            await _image_cache_put(cache_key, image, file_path or saved_path)
         
         # Prepare response message
-        message = f"🎨 **Image Generated Successfully with Pollinations.AI!**\n\n"
-        message += f"**Prompt**: {prompt}\n"
+        parts = ["🎨 **Image Generated Successfully with Pollinations.AI!**\n\n", f"**Prompt**: {prompt}\n"]
         if style:
-            message += f"**Style**: {style}\n"
-        message += f"**Dimensions**: {width} × {height} pixels\n"
+            parts.append(f"**Style**: {style}\n")
+        parts.append(f"**Dimensions**: {width} × {height} pixels\n")
         if seed is not None:
-            message += f"**Seed**: {seed} (use same seed to reproduce)\n"
-        
+            parts.append(f"**Seed**: {seed} (use same seed to reproduce)\n")
         if file_path:
-            message += f"**Saved to**: `{file_path}`\n"
+            parts.append(f"**Saved to**: `{file_path}`\n")
+        parts += ("\n<image>", image.image_base64, "</image>\n\n", _GENERATE_TIPS)
+        
+        return Response(message="".join(parts), break_loop=False)
+    
+    async def generate_batch(
+        self,
+        prompts: List[Dict[str, Any]],
+        max_parallel: int = 4,
+        client: Optional[DockerMultimediaClient] = None
+    ) -> List[Any]:
+        """Generate several images concurrently over the shared client, at most max_parallel at a time"""
+        
+        client = client or await get_docker_client()
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+        
+        async def _one(request: Dict[str, Any]) -> Optional[GeneratedImage]:
+            async with semaphore:
+                return await client.generate_image_pollinations_result(**request)
+        
+        return await asyncio.gather(*(_one(request) for request in prompts), return_exceptions=True)
+    
+    async def _generate_batch_images(self, client: DockerMultimediaClient, kwargs: Dict[str, Any]) -> Response:
+        """Generate a batch of images using Pollinations.AI"""
+        
+        prompts = kwargs.get("prompts") or []
+        if isinstance(prompts, str):
+            prompts = json.loads(prompts)
+        requests = [
+            _normalize_batch_request(p if isinstance(p, dict) else {"prompt": str(p)})
+            for p in prompts
+        ]
+        requests = [r for r in requests if str(r.get("prompt", "")).strip()]
+        if not requests:
+            return Response(
+                message="❌ Please provide a 'prompts' list describing the images to generate.",
+                break_loop=False
+            )
         
-        message += f"\n<image>{image_base64}</image>\n\n"
+        if not client.is_service_available('pollinations'):
+            _invalidate_health()
+            await _check_services_health(client)
+        if not client.is_service_available('pollinations'):
+            return Response(
+                message="❌ Pollinations.AI service is not available. Use 'pollinations_integration operation=health' to check status.",
+                break_loop=False
+            )
         
-        message += f"💡 **Tips for better results:**\n"
-        message += f"• Be specific about details, colors, and composition\n"
-        message += f"• Add style keywords like 'photorealistic', 'artistic', 'cartoon'\n"
-        message += f"• Use lighting terms like 'golden hour', 'studio lighting'\n"
-        message += f"• Save the seed number to recreate similar images\n"
+        max_parallel = int(kwargs.get("max_parallel", 4))
+        save_to_file = kwargs.get("save_to_file", True)
         
-        return Response(message=message, break_loop=False)
+        _INFO.print(f"🎨 Generating {len(requests)} images with Pollinations.AI...")
+        results = await self.generate_batch(requests, max_parallel, client)
+        
+        parts = ["🎨 **Batch Generation with Pollinations.AI**\n\n"]
+        generated = 0
+        for request, result in zip(requests, results):
+            prompt = request["prompt"]
+            if isinstance(result, GeneratedImage):
+                generated += 1
+                file_path = await self._save_image_to_deliverables(result.data, prompt) if save_to_file else None
+                parts.append(f"✅ **{prompt}**\n")
+                if file_path:
+                    parts.append(f"**Saved to**: `{file_path}`\n")
+                parts += ("<image>", result.image_base64, "</image>\n\n")
+            else:
+                error = f": {result}" if isinstance(result, Exception) else ""
+                parts.append(f"❌ **{prompt}** - generation failed{error}\n\n")
+        
+        if generated < len(requests):
+            _invalidate_health()
+        parts.append(f"**Generated**: {generated}/{len(requests)} images\n")
+        
+        return Response(message="".join(parts), break_loop=False)
     
-    async def _save_image_to_deliverables(self, image_base64: str, prompt: str) -> Optional[str]:
+    async def _save_image_to_deliverables(self, image_data: bytes, prompt: str) -> Optional[str]:
         """Save generated image to deliverables folder with organized structure"""
         
         try:
-            import datetime
-            import hashlib
-            
-            # Create organized folder structure
-            images_dir = os.path.join(self.deliverables_path, "images")
-            await create_folder(images_dir)
+            now = datetime.datetime.now()
             
             # Determine category based on prompt
             category = self._categorize_prompt(prompt)
-            category_dir = os.path.join(images_dir, category)
-            await create_folder(category_dir)
-            
-            # Create by-date backup folder
-            date_str = datetime.datetime.now().strftime("%Y/%m/%d")
-            date_dir = os.path.join(images_dir, "by_date", date_str)
-            await create_folder(date_dir)
+            category_dir = _CATEGORY_DIRS[category]
             
-            # Generate unique filename
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:8]
-            filename = f"pb_img_{category}_{timestamp}_{prompt_hash}.png"
+            # By-date backup folder
+            date_dir = _IMAGES_DIR / "by_date" / f"{now.year}/{now.month:02}/{now.day:02}"
             
-            # Save to primary category location
-            primary_path = os.path.join(category_dir, filename)
+            # Only the by-date folder is new on most days, the rest exist after the first save
+            dirs = (date_dir, *_CATEGORY_DIRS.values())
+            if not _created_dirs.issuperset(dirs):
+                await asyncio.to_thread(_ensure_dirs, *dirs)
             
-            # Decode and save image
-            image_data = base64.b64decode(image_base64)
-            await write_file(primary_path, image_data, mode='wb')
+            # Generate unique filename; the random suffix keeps images of the same
+            # prompt saved within one second (e.g. in a batch) apart
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            prompt_hash = hashlib.blake2b(prompt.encode("utf-8"), digest_size=4).hexdigest()
+            filename = f"pb_img_{category}_{timestamp}_{prompt_hash}_{secrets.token_hex(3)}.png"
             
-            # Create backup in date folder
-            backup_path = os.path.join(date_dir, filename)
-            await write_file(backup_path, image_data, mode='wb')
+            # Primary category location and backup in date folder
+            primary_path = category_dir / filename
+            backup_path = date_dir / filename
             
-            # Create metadata file
+            # Metadata file
             metadata = {
                 "prompt": prompt,
-                "timestamp": datetime.datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "category": category,
                 "service": "pollinations.ai",
                 "filename": filename,
                 "paths": {
-                    "primary": primary_path,
-                    "backup": backup_path
+                    "primary": str(primary_path),
+                    "backup": str(backup_path)
                 }
             }
+            metadata_path = primary_path.with_suffix('.json')
             
-            metadata_path = os.path.join(category_dir, filename.replace('.png', '.json'))
-            await write_file(metadata_path, str(metadata))
+            # The three writes are independent, run them concurrently
+            await asyncio.gather(
+                asyncio.to_thread(_write_bytes, primary_path, image_data),
+                asyncio.to_thread(_write_bytes, backup_path, image_data),
+                asyncio.to_thread(_write_bytes, metadata_path, json.dumps(metadata, ensure_ascii=False).encode("utf-8")),
+            )
             
             PrintStyle(font_color="green").print(f"💾 Image saved to: {primary_path}")
-            return primary_path
+            return str(primary_path)
             
         except Exception as e:
             PrintStyle.warning(f"Failed to save image: {e}")
@@ -283,29 +542,14 @@ class PollinationsIntegration(Tool):
         
         prompt_lower = prompt.lower()
         
-        # Portrait/Character detection
-        if any(word in prompt_lower for word in ['portrait', 'headshot', 'person', 'face', 'human', 'character', 'selfie', 'avatar']):
-            return 'portraits'
-        
-        # Landscape/Nature detection
-        if any(word in prompt_lower for word in ['landscape', 'mountain', 'forest', 'beach', 'nature', 'sunset', 'sunrise', 'scenery', 'outdoor']):
-            return 'landscapes'
-        
-        # Artwork/Creative detection
-        if any(word in prompt_lower for word in ['abstract', 'artistic', 'painting', 'drawing', 'creative', 'art', 'illustration', 'design']):
-            return 'artwork'
-        
-        # Product/Commercial detection
-        if any(word in prompt_lower for word in ['product', 'commercial', 'advertisement', 'marketing', 'brand', 'logo', 'business']):
-            return 'product_photos'
-        
-        # Social media detection
-        if any(word in prompt_lower for word in ['social media', 'instagram', 'facebook', 'post', 'story', 'thumbnail', 'cover']):
-            return 'social_media'
+        hits = {_CATEGORY_MAP[token] for token in _WORD_RE.findall(prompt_lower) if token in _CATEGORY_MAP}
+        if 'social media' in prompt_lower:
+            hits.add('social_media')
         
-        # Educational detection
-        if any(word in prompt_lower for word in ['educational', 'diagram', 'infographic', 'chart', 'instruction', 'tutorial', 'learning']):
-            return 'educational'
+        # First category in priority order wins
+        for category in _CATEGORY_KEYWORDS:
+            if category in hits:
+                return category
         
         # Default category
         return 'general'
@@ -3,6 +3,10 @@ Register Docker Multimedia Tools with Agent Zero
 This script registers all Docker-based multimedia generation tools
 """
 
+import functools
+import os
+from types import MappingProxyType
+
 # Import all the Docker multimedia tools
 from .docker_multimedia_generator import (
     generate_image_docker_tool,
@@ -16,7 +20,7 @@ from .docker_multimedia_detector import (
 )
 
 # Tool descriptions for Agent Zero
-DOCKER_MULTIMEDIA_TOOLS = {
+_DOCKER_MULTIMEDIA_TOOLS = {
     "generate_image_docker_tool": {
         "function": generate_image_docker_tool,
         "description": """Generate high-quality images using Docker Pollinations.AI service.
@@ -151,9 +155,21 @@ DOCKER_MULTIMEDIA_TOOLS = {
     }
 }
 
+# Read-only view of the tool table, shared by all callers
+DOCKER_MULTIMEDIA_TOOLS = MappingProxyType({
+    name: MappingProxyType(info) for name, info in _DOCKER_MULTIMEDIA_TOOLS.items()
+})
+
+_REGISTERED = False
+_REGISTERED_TOOLS = ()
+
 def register_tools_with_agent_zero():
     """Register all Docker multimedia tools with Agent Zero system"""
     
+    global _REGISTERED, _REGISTERED_TOOLS
+    if _REGISTERED:
+        return _REGISTERED_TOOLS
+    
     registered_tools = []
     
     for tool_name, tool_info in DOCKER_MULTIMEDIA_TOOLS.items():
@@ -164,107 +180,17 @@ def register_tools_with_agent_zero():
             
             print(f"✅ Registered: {tool_name}")
     
-    return registered_tools
+    _REGISTERED_TOOLS = tuple(registered_tools)
+    _REGISTERED = True
+    return _REGISTERED_TOOLS
 
+@functools.lru_cache(maxsize=1)
 def get_tools_documentation():
     """Get comprehensive documentation for all Docker multimedia tools"""
     
-    documentation = """
-# Docker Multimedia Tools Documentation
-
-Pareng Boyong now has access to advanced Docker-based multimedia generation tools:
-
-## 🎨 Image Generation Tools
-
-### generate_image_docker_tool
-- **Service**: Pollinations.AI (FLUX.1 model)
-- **Quality**: Professional, photorealistic
-- **Categories**: Portraits, landscapes, artwork, product photos, social media
-- **Auto-organization**: Files saved to organized folders with metadata
-- **Performance**: Fast generation, excellent quality
-
-## 🎬 Video Generation Tools  
-
-### generate_video_docker_tool
-- **Service**: Wan2GP (CPU-optimized)
-- **Models**: 4 advanced models with auto-selection
-  - **wan_vace_14b**: Highest quality (14B parameters)
-  - **fusionix**: 50% faster, cinematic quality
-  - **multitalk**: Multi-character conversations
-  - **wan2gp**: Low-VRAM, accessible on older GPUs
-- **Categories**: Cinematic, conversational, educational, marketing
-- **Durations**: 2-15 seconds
-- **Resolutions**: 480p, 720p, 1080p
-
-## 🔍 Smart Detection System
-
-### detect_multimedia_request & auto_generate_multimedia
-- **Languages**: English and Filipino support
-- **Confidence Scoring**: AI-powered accuracy assessment
-- **Auto-activation**: High confidence requests auto-generate
-- **Context Awareness**: Understands user intent and preferences
-
-## 🔧 System Management
-
-### check_docker_multimedia_services
-- **Monitoring**: Real-time service health checks
-- **Services**: LocalAI, Pollinations.AI, Wan2GP
-- **Troubleshooting**: Detailed status information
-
-### batch_generate_multimedia
-- **Efficiency**: Multiple items in parallel
-- **Mixed Content**: Images and videos in same batch
-- **Performance**: Optimal resource utilization
-
-## 📁 File Organization
-
-All generated content is automatically organized in:
-```
-/root/projects/pareng-boyong/pareng_boyong_deliverables/
-├── images/
-│   ├── portraits/
-│   ├── landscapes/  
-│   ├── artwork/
-│   ├── product_photos/
-│   └── social_media/
-├── videos/
-│   ├── cinematic/
-│   ├── conversational/
-│   ├── educational/
-│   └── marketing/
-└── projects/
-    ├── completed/
-    └── in_progress/
-```
-
-## 🚀 Usage Examples
-
-**Simple Image Generation:**
-```python
-result = generate_image_docker_tool("A professional portrait of a businessman in a modern office")
-```
-
-**Advanced Video Generation:**
-```python
-result = generate_video_docker_tool(
-    "A cinematic scene of rain falling on a city street", 
-    duration=8, 
-    resolution="1080p", 
-    model="fusionix"
-)
-```
-
-**Automatic Detection:**
-```python
-analysis = detect_multimedia_request("Create a beautiful sunset image")
-if analysis["should_activate"]:
-    result = auto_generate_multimedia("Create a beautiful sunset image")
-```
-
-All tools return comprehensive results with file paths, metadata, and generation details.
-"""
-    
-    return documentation
+    # Kept in a sibling resource file, read on first request only
+    with open(os.path.join(os.path.dirname(__file__), "docker_multimedia_tools.md"), encoding="utf-8") as f:
+        return f.read()
 
 # Register tools on import
 if __name__ == "__main__":
@@ -1,51 +1,176 @@
 from python.helpers.tool import Tool, Response
+from python.helpers.print_style import PrintStyle
+from typing import Optional
+import asyncio
+import functools
 import re
+import time
+
+try:
+    import re2
+except ImportError:
+    # Optional linear-time engine, the stdlib re module is used instead
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional accelerator, plain substring checks are used instead
+    ahocorasick = None
+
+# Enhanced detection patterns for responses
+_IMAGE_PATTERNS = (
+    r'(i\'ll|let me|i will)\s+(create|generate|make|design)\s+(an?\s+)?(image|picture|photo|artwork)',
+    r'(creating|generating|making)\s+(an?\s+)?(image|picture|photo|artwork)',
+    r'(here\'s|here is)\s+(an?\s+)?(image|picture|photo)',
+    r'\b(create|generate|make|draw|design)\s+(an?\s+)?(image|picture|photo|artwork|larawan)',
+    r'gumawa\s+ng\s+(larawan|image)'
+)
+
+_VIDEO_PATTERNS = (
+    r'(i\'ll|let me|i will)\s+(create|generate|make|produce)\s+(a\s+)?(video|animation|clip)',
+    r'(creating|generating|making)\s+(a\s+)?(video|animation|clip)',
+    r'(here\'s|here is)\s+(a\s+)?(video|animation|clip)',
+    r'\b(create|generate|make|produce)\s+(a\s+)?(video|animation|clip|movie)',
+    r'(cinematic|film)\s+(video|scene)',
+    r'gumawa\s+ng\s+video'
+)
+
+# All alternatives fused into one pattern so a single pass finds the first match;
+# image alternatives come first, so a tie at the same position resolves to image
+def _compile(pattern: str):
+    """Compile with RE2 when available, the patterns are plain regular expressions"""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+# Inline (?i) works in both engines and saves lower-casing the whole text first
+_IMAGE_RE = _compile('(?i)' + '|'.join(_IMAGE_PATTERNS))
+_DETECTION_RE = _compile('(?i)(?P<img>' + '|'.join(_IMAGE_PATTERNS) + ')|(?P<vid>' + '|'.join(_VIDEO_PATTERNS) + ')')
+
+
+# Every detection pattern contains one of these literals, so text without any of
+# them cannot match and skips the full regex
+_KEYWORDS = ("image", "picture", "photo", "artwork", "larawan", "video", "animation", "clip", "movie", "scene")
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+    def _has_keyword(text: str) -> bool:
+        return next(_KEYWORD_AUTOMATON.iter(text), None) is not None
+else:
+    def _has_keyword(text: str) -> bool:
+        # str.__contains__ is a C-level substring search, cheaper than a regex pass for ten literals
+        return any(keyword in text for keyword in _KEYWORDS)
+
+
+def _detect(text: str) -> Optional[str]:
+    """Return 'image', 'video' or None for a response text"""
+    
+    # Most responses are not multimedia requests; the guard sees the text lower-cased,
+    # so it rejects nothing the case-insensitive pattern could match
+    if not _has_keyword(text.lower()):
+        return None
+    
+    match = _DETECTION_RE.search(text)
+    if match is None:
+        return None
+    
+    # Image requests take precedence over video ones anywhere in the text
+    if match.group("img") or _IMAGE_RE.search(text, match.start() + 1):
+        return "image"
+    return "video"
+
+# Generation intents are announced near the start of a response ("I'll create..."),
+# so only this many leading characters are scanned, keeping detection cost flat
+# for long responses that carry tool output or transcripts
+_DETECT_WINDOW = 2048
+_detect_cached = functools.lru_cache(maxsize=1024)(_detect)
+
+
+# Docker multimedia tools, imported on first use and kept for later responses
+_DMM = None
+_HEALTH_TTL = 30.0
+# A degraded Docker service must not hold the response back
+_HEALTH_TIMEOUT = 1.5
+_HEALTH_CACHE = (0.0, None)
+
+def _get_dmm():
+    global _DMM
+    if _DMM is None:
+        from python.tools import docker_multimedia_generator as _DMM
+    return _DMM
+
+def _check_services_health() -> dict:
+    """Docker multimedia service health, re-probed at most every _HEALTH_TTL seconds"""
+    global _HEALTH_CACHE
+    now = time.monotonic()
+    checked_at, health_status = _HEALTH_CACHE
+    if health_status is None or now - checked_at > _HEALTH_TTL:
+        health_status = _get_dmm().check_docker_multimedia_services()
+        _HEALTH_CACHE = (now, health_status)
+    return health_status
+
+
+_PROJECT_ROOT = "/root/projects/pareng-boyong"
+_DELIVERABLES_PREFIX = _PROJECT_ROOT + "/pareng_boyong_deliverables/"
+
+def _web_path(file_path: str) -> str:
+    """Deliverables URL path for a saved file; paths outside deliverables are left as is"""
+    if file_path.startswith(_DELIVERABLES_PREFIX):
+        return file_path.removeprefix(_PROJECT_ROOT)
+    return file_path
+
+
+# Auto-generated media sections appended to the response text
+_IMG_TEMPLATE = (
+    "{message}\n\n"
+    "🎨 **Auto-Generated Image**\n"
+    "**Service:** Pollinations.AI (FLUX.1)\n"
+    "**Category:** {category}\n"
+    "**File:** `{file_path}`\n"
+    "**View:** [Click to view]({web_path})\n\n"
+    "{image}"
+)
+
+# The video payload is joined on separately rather than formatted in
+_VID_TEMPLATE = (
+    "{message}\n\n"
+    "🎬 **Auto-Generated Video**  \n"
+    "**Service:** Wan2GP (CPU-optimized)\n"
+    "**Model:** {model}\n"
+    "**Duration:** {duration}s\n"
+    "**File:** `{file_path}`\n"
+    "**View:** [Click to view]({web_path})\n\n"
+)
 
 
 class ResponseTool(Tool):
 
+    # Adds no per-instance state beyond Tool; instances keep Tool's __dict__
+    # until the base class itself is slotted
+    __slots__ = ()
+
     def detect_multimedia_in_response(self, text: str) -> dict:
         """Detect multimedia generation requests in response text"""
         
-        text_lower = text.lower()
-        
-        # Enhanced detection patterns for responses
-        image_patterns = [
-            r'(i\'ll|let me|i will)\s+(create|generate|make|design)\s+(an?\s+)?(image|picture|photo|artwork)',
-            r'(creating|generating|making)\s+(an?\s+)?(image|picture|photo|artwork)',
-            r'(here\'s|here is)\s+(an?\s+)?(image|picture|photo)',
-            r'\b(create|generate|make|draw|design)\s+(an?\s+)?(image|picture|photo|artwork|larawan)',
-            r'gumawa\s+ng\s+(larawan|image)'
-        ]
-        
-        video_patterns = [
-            r'(i\'ll|let me|i will)\s+(create|generate|make|produce)\s+(a\s+)?(video|animation|clip)',
-            r'(creating|generating|making)\s+(a\s+)?(video|animation|clip)',
-            r'(here\'s|here is)\s+(a\s+)?(video|animation|clip)',
-            r'\b(create|generate|make|produce)\s+(a\s+)?(video|animation|clip|movie)',
-            r'(cinematic|film)\s+(video|scene)',
-            r'gumawa\s+ng\s+video'
-        ]
+        # Repeated responses (boilerplate, retries) reuse earlier results; the cache is
+        # keyed on the bounded scan window so it stays small in memory
+        media_type = _detect_cached(text[:_DETECT_WINDOW])
+        if media_type is None:
+            return {"type": None, "confidence": 0.0}
         
-        # Check for image requests
-        for pattern in image_patterns:
-            if re.search(pattern, text_lower):
-                return {
-                    "type": "image",
-                    "confidence": 0.7,
-                    "prompt": text
-                }
-        
-        # Check for video requests
-        for pattern in video_patterns:
-            if re.search(pattern, text_lower):
-                return {
-                    "type": "video",
-                    "confidence": 0.7,
-                    "prompt": text
-                }
-        
-        return {"type": None, "confidence": 0.0}
+        return {
+            "type": media_type,
+            "confidence": 0.7,
+            "prompt": text
+        }
 
     async def execute(self, **kwargs):
         message = self.args["text"] if "text" in self.args else self.args["message"]
@@ -55,19 +180,28 @@ class ResponseTool(Tool):
             detection = self.detect_multimedia_in_response(message)
             
             if detection["type"] and detection["confidence"] > 0.6:
-                # Import Docker multimedia tools
-                from python.tools.docker_multimedia_generator import (
-                    generate_image_docker_tool,
-                    generate_video_docker_tool,
-                    check_docker_multimedia_services
-                )
+                try:
+                    dmm = _get_dmm()
+                except ImportError:
+                    # Docker multimedia tools not installed, plain response
+                    return Response(message=message, break_loop=True)
+                
+                # The Docker tools are blocking (they run their own event loop via asyncio.run),
+                # so they go to a worker thread instead of stalling this loop; a probe that
+                # times out keeps running there and still refreshes the health cache
+                try:
+                    health_status = await asyncio.wait_for(
+                        asyncio.to_thread(_check_services_health), timeout=_HEALTH_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    PrintStyle.warning("Docker multimedia health check timed out, sending plain response")
+                    return Response(message=message, break_loop=True)
                 
-                # Check service health
-                health_status = check_docker_multimedia_services()
                 if health_status["overall_status"] in ["healthy", "partial"]:
                     
                     if detection["type"] == "image":
-                        result = generate_image_docker_tool(
+                        result = await asyncio.to_thread(
+                            dmm.generate_image_docker_tool,
                             prompt=message,
                             width=1024,
                             height=1024
@@ -75,23 +209,29 @@ class ResponseTool(Tool):
                         
                         if result.get("status") == "success":
                             file_path = result.get("file_path", "")
-                            web_path = file_path.replace("/root/projects/pareng-boyong/pareng_boyong_deliverables/", "/pareng_boyong_deliverables/")
+                            web_path = _web_path(file_path)
                             metadata = result.get("metadata", {})
                             
-                            multimedia_message = f"""{message}
-
-🎨 **Auto-Generated Image**
-**Service:** Pollinations.AI (FLUX.1)
-**Category:** {metadata.get('category', 'artwork').replace('_', ' ').title()}
-**File:** `{file_path}`
-**View:** [Click to view]({web_path})
-
-<image>{result.get('image_base64', '')}</image>"""
+                            # Reference the saved file (the UI serves img:// paths through /image_get)
+                            # instead of inlining ~1.4MB of base64 into the message and chat history
+                            if file_path:
+                                image_markup = f"![Auto-Generated Image](img://{file_path})"
+                            else:
+                                image_markup = f"<image>{result.get('image_base64', '')}</image>"
+                            
+                            multimedia_message = _IMG_TEMPLATE.format_map({
+                                "message": message,
+                                "category": metadata.get('category', 'artwork').replace('_', ' ').title(),
+                                "file_path": file_path,
+                                "web_path": web_path,
+                                "image": image_markup,
+                            })
                             
                             return Response(message=multimedia_message, break_loop=True)
                     
                     elif detection["type"] == "video":
-                        result = generate_video_docker_tool(
+                        result = await asyncio.to_thread(
+                            dmm.generate_video_docker_tool,
                             prompt=message,
                             duration=4,
                             resolution="720p"
@@ -99,25 +239,23 @@ class ResponseTool(Tool):
                         
                         if result.get("status") == "success":
                             file_path = result.get("file_path", "")
-                            web_path = file_path.replace("/root/projects/pareng-boyong/pareng_boyong_deliverables/", "/pareng_boyong_deliverables/")
+                            web_path = _web_path(file_path)
                             metadata = result.get("metadata", {})
                             
-                            multimedia_message = f"""{message}
-
-🎬 **Auto-Generated Video**  
-**Service:** Wan2GP (CPU-optimized)
-**Model:** {metadata.get('model', 'wan2gp')}
-**Duration:** {metadata.get('duration', 4)}s
-**File:** `{file_path}`
-**View:** [Click to view]({web_path})
-
-<video>{result.get('video_base64', '')}</video>"""
+                            header = _VID_TEMPLATE.format_map({
+                                "message": message,
+                                "model": metadata.get('model', 'wan2gp'),
+                                "duration": metadata.get('duration', 4),
+                                "file_path": file_path,
+                                "web_path": web_path,
+                            })
+                            multimedia_message = "".join((header, "<video>", result.get('video_base64', ''), "</video>"))
                             
                             return Response(message=multimedia_message, break_loop=True)
                 
-        except (ImportError, Exception) as e:
+        except Exception as e:
             # If multimedia fails, just use original message
-            pass
+            PrintStyle.error(f"Auto multimedia generation failed: {e}")
             
         return Response(message=message, break_loop=True)
 
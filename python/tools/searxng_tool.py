@@ -1,16 +1,84 @@
 from python.helpers.tool import Tool, Response
 from python.helpers.print_style import PrintStyle
 from python.helpers.searxng import search
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Sized
+import asyncio
+import itertools
 import json
+import time
+
+try:
+    import orjson
+except ImportError:
+    # Optional faster serializer, the stdlib json module is used instead
+    orjson = None
+
+_RESULT_TEMPLATE = "{position}. {title}\n   URL: {url}\n   {snippet}...\n"
+
+
+_QUERY_CACHE_TTL = 300
+_QUERY_CACHE_MAX = 128
+_QUERY_CACHE: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+# In-flight searches keyed by (event loop, query), futures are loop bound
+_IN_FLIGHT: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
+
+async def _cached_search(query: str):
+    now = time.monotonic()
+    cached = _QUERY_CACHE.get(query)
+    if cached is not None:
+        if now - cached[0] < _QUERY_CACHE_TTL:
+            _QUERY_CACHE.move_to_end(query)
+            return cached[1]
+        del _QUERY_CACHE[query]
+
+    key = (asyncio.get_running_loop(), query)
+    pending = _IN_FLIGHT.get(key)
+    if pending is not None:
+        # asyncio.wait leaves the shared future untouched if this waiter is cancelled
+        await asyncio.wait((pending,))
+        if not pending.cancelled():
+            return pending.result()
+        return await search(query)
+
+    future = asyncio.get_running_loop().create_future()
+    _IN_FLIGHT[key] = future
+    try:
+        results = await search(query)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so a failure nobody else awaited is not logged
+        future.exception()
+        raise
+    else:
+        future.set_result(results)
+        if isinstance(results, dict) and "results" in results:
+            _QUERY_CACHE[query] = (time.monotonic(), results)
+            while len(_QUERY_CACHE) > _QUERY_CACHE_MAX:
+                _QUERY_CACHE.popitem(last=False)
+        return results
+    finally:
+        _IN_FLIGHT.pop(key, None)
+
+
+def _dumps(data) -> str:
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
 
 
-@dataclass
 class SearXNGTool(Tool):
     """
     SearXNG search engine integration for Pareng Boyong
     Provides privacy-focused web search capabilities
     """
+
+    # Adds no per-instance state beyond Tool
+    __slots__ = ()
     
     async def execute(self, **kwargs):
         await self.agent.handle_intervention()
@@ -27,42 +95,57 @@ class SearXNGTool(Tool):
                 f"Searching SearXNG for: {query}"
             )
             
-            # Perform the search using the helper
-            results = await search(query)
+            # Perform the search using the helper, reusing recent or in-flight identical queries
+            results = await _cached_search(query)
             
             # Process and format results
             if isinstance(results, dict) and "results" in results:
                 search_results = results["results"]
                 
-                # Format results for display
+                output_format = str(self.args.get("format", "full")).strip().lower()
+                include_json = output_format != "text"
+                
+                # Build the text summary and, unless only text was requested,
+                # the structured results in a single pass
                 formatted_results = []
-                for idx, result in enumerate(search_results[:10], 1):  # Limit to top 10
-                    formatted_result = {
+                text_parts = [f"SearXNG Search Results for '{query}':\n"]
+                for idx, result in enumerate(itertools.islice(search_results, 10), 1):  # Limit to top 10
+                    title = result.get("title", "No title")
+                    url = result.get("url", "")
+                    content = result.get("content", "No description available")
+                    text_parts.append(_RESULT_TEMPLATE.format_map({
                         "position": idx,
-                        "title": result.get("title", "No title"),
-                        "url": result.get("url", ""),
-                        "content": result.get("content", "No description available"),
-                        "engine": result.get("engine", "Unknown")
-                    }
-                    formatted_results.append(formatted_result)
+                        "title": title,
+                        "url": url,
+                        "snippet": content[:150],
+                    }))
+                    if include_json:
+                        formatted_results.append({
+                            "position": idx,
+                            "title": title,
+                            "url": url,
+                            "content": content,
+                            "engine": result.get("engine", "Unknown")
+                        })
+                
+                text_summary = "\n".join(text_parts)
+                if not include_json:
+                    return Response(message=text_summary, break_loop=False)
                 
                 # Create response message
                 response_data = {
                     "query": query,
-                    "total_results": len(search_results),
+                    "total_results": len(search_results) if isinstance(search_results, Sized) else len(formatted_results),
                     "displayed_results": len(formatted_results),
                     "results": formatted_results
                 }
                 
-                # Also create a text summary
-                text_summary = f"SearXNG Search Results for '{query}':\n\n"
-                for result in formatted_results:
-                    text_summary += f"{result['position']}. {result['title']}\n"
-                    text_summary += f"   URL: {result['url']}\n"
-                    text_summary += f"   {result['content'][:150]}...\n\n"
-                
                 return Response(
-                    message=text_summary + "\n\nFull results:\n" + json.dumps(response_data, indent=2),
+                    message="".join((
+                        text_summary,
+                        "\n\nFull results:\n",
+                        _dumps(response_data),
+                    )),
                     break_loop=False
                 )
             else:
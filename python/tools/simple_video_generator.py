@@ -5,13 +5,20 @@ Uses cloud-based APIs for video generation to avoid heavy dependencies
 
 import asyncio
 import base64
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import re
+import shutil
 import time
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 import hashlib
+import secrets
+import sqlite3
 
 # Import environment loader
 try:
@@ -23,57 +30,242 @@ except ImportError:
         value = os.getenv(key)
         return value is not None and value.strip() != ""
 
+try:
+    import orjson
+except ImportError:
+    # Optional faster serializer, the stdlib json module is used instead
+    orjson = None
+
+try:
+    from python.helpers import replicate_webhooks
+except ImportError:
+    # Running outside the web app, predictions are only polled
+    replicate_webhooks = None
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional accelerator, a single compiled regex is used instead
+    ahocorasick = None
+
+# Category keywords in priority order, matched as substrings of the prompt
+_CATEGORY_KEYWORDS = (
+    ('conversational', ('conversation', 'dialogue', 'talking', 'discussion')),
+    ('cinematic', ('cinematic', 'film', 'dramatic', 'movie')),
+    ('educational', ('educational', 'tutorial', 'learning', 'explain')),
+    ('marketing', ('marketing', 'advertisement', 'commercial', 'product')),
+    ('social_media', ('social media', 'instagram', 'tiktok', 'short')),
+    ('animations', ('animation', 'cartoon', 'animate')),
+)
+# Deliverables folders, parents before children
+_VIDEO_DIRS = (
+    "videos",
+    "videos/animations",
+    "videos/cinematic",
+    "videos/conversational",
+    "videos/educational",
+    "videos/marketing",
+    "videos/social_media",
+)
+
+# Video types that fix the category regardless of the prompt
+_TYPE_TO_CATEGORY = {"conversational": "conversational"}
+
+_CATEGORY_PRIORITY = {category: rank for rank, (category, _) in enumerate(_CATEGORY_KEYWORDS)}
+
+if ahocorasick is not None:
+    _CATEGORY_AUTOMATON = ahocorasick.Automaton()
+    for _category, _keywords in _CATEGORY_KEYWORDS:
+        for _keyword in _keywords:
+            _CATEGORY_AUTOMATON.add_word(_keyword, _category)
+    _CATEGORY_AUTOMATON.make_automaton()
+
+    def _matched_categories(text: str):
+        return (category for _, category in _CATEGORY_AUTOMATON.iter(text))
+else:
+    # One alternation per category as a named group, so one scan reports every hit;
+    # keywords are reported by where they start, the same as substring checks
+    _CATEGORY_RE = re.compile('|'.join(
+        f"(?=(?P<{category}>{'|'.join(map(re.escape, keywords))}))"
+        for category, keywords in _CATEGORY_KEYWORDS
+    ))
+
+    def _matched_categories(text: str):
+        return (match.lastgroup for match in _CATEGORY_RE.finditer(text))
+
+def _categorize_prompt(prompt_lower: str) -> Optional[str]:
+    """Highest priority category with a keyword in the prompt, in one scan"""
+    best = None
+    for category in _matched_categories(prompt_lower):
+        if best is None or _CATEGORY_PRIORITY[category] < _CATEGORY_PRIORITY[best]:
+            best = category
+            if _CATEGORY_PRIORITY[best] == 0:
+                break
+    return best
+
+def _svd_input(prompt: str, duration: int, fps: int, style: str) -> Dict[str, Any]:
+    return {
+        "input_image": prompt,  # This would need an image for SVD
+        "frames_per_second": fps,
+        "motion_bucket_id": 127
+    }
+
+def _zeroscope_input(prompt: str, duration: int, fps: int, style: str) -> Dict[str, Any]:
+    return {
+        "prompt": f"{prompt}, {style} style, high quality",
+        "num_frames": min(duration * fps, 24),  # ZeroScope limit
+        "fps": fps,
+        "num_inference_steps": 20,
+        "guidance_scale": 15.0
+    }
+
+def _animatediff_input(prompt: str, duration: int, fps: int, style: str) -> Dict[str, Any]:
+    return {
+        "prompt": f"{prompt}, {style} style, smooth animation",
+        "num_frames": duration * fps,
+        "guidance_scale": 7.5,
+        "num_inference_steps": 25
+    }
+
+def _link_or_copy(source: str, target: str):
+    """Hard link target to source so the backup costs no extra writes, copying
+    when the filesystem can't link (e.g. the folders are on different devices)"""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if os.path.lexists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+class _LazyBase64:
+    """A saved video's base64 encoding, produced only when asked for and kept
+    once made; repr() stays short so logging a result dict doesn't render the
+    whole video"""
+    __slots__ = ("path", "size", "_encoded")
+    
+    # Read size for encoding, a multiple of 3 so blocks encode without padding
+    _BLOCK = 3 << 18
+    
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+        self._encoded = None
+    
+    def encode(self) -> str:
+        """Encode the file block by block rather than reading it whole first"""
+        if self._encoded is None:
+            encoded = []
+            with open(self.path, 'rb') as f:
+                while block := f.read(self._BLOCK):
+                    encoded.append(base64.b64encode(block))
+            self._encoded = b"".join(encoded).decode('ascii')
+        return self._encoded
+    
+    def __str__(self):
+        return self.encode()
+    
+    def __repr__(self):
+        return f"<base64 {self.size}B>"
+    
+    def __bool__(self):
+        return self.size > 0
+
+def _write_metadata(metadata_path: str, metadata: Dict):
+    """Write the metadata sidecar in one call"""
+    if orjson is not None:
+        data = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(metadata, indent=2).encode()
+    with open(metadata_path, 'wb') as f:
+        f.write(data)
+
+# Shared keep-alive session for the synchronous status probe, which runs on every
+# status call; transient gateway errors are retried with backoff
+_http_session: Optional[requests.Session] = None
+
+def _get_http_session() -> requests.Session:
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        session.mount("https://", adapter)
+        _http_session = session
+    return _http_session
+
 class SimpleVideoGenerator:
     """
     Simple video generator using cloud APIs
     Provides fallback video generation when ComfyUI is not available
     """
     
+    # Set once the category folders exist, so later instances skip the makedirs calls
+    _dirs_ready = False
+    
+    # Replicate model reference and input builder per model; only the selected
+    # model's input is built for a request
+    _MODEL_META = {
+        "stable-video-diffusion": ("stability-ai/stable-video-diffusion", _svd_input),
+        "zeroscope-v2": ("anotherjesse/zeroscope-v2-xl", _zeroscope_input),
+        "animatediff": ("lucataco/animate-diff", _animatediff_input),
+    }
+    
     def __init__(self):
         self.replicate_token = get_env('REPLICATE_API_TOKEN')
+        # Public base URL of the web UI; when set, Replicate calls back on completion
+        # and status polling only runs as a slow fallback
+        self.webhook_base_url = get_env('REPLICATE_WEBHOOK_BASE_URL')
         self.deliverables_path = "/root/projects/pareng-boyong/pareng_boyong_deliverables"
-        self._ensure_directories()
+        self._ensure_directories(self.deliverables_path)
+        self.cache_db_path = f"{self.deliverables_path}/videos/.cache/video_index.sqlite"
+    
+    def _open_session(self) -> aiohttp.ClientSession:
+        """HTTP session for one generation; the prediction request, every status
+        poll and the download share its pooled connections"""
+        return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
     
-    def _ensure_directories(self):
-        """Ensure deliverables directories exist"""
-        directories = [
-            f"{self.deliverables_path}/videos/cinematic",
-            f"{self.deliverables_path}/videos/conversational", 
-            f"{self.deliverables_path}/videos/educational",
-            f"{self.deliverables_path}/videos/marketing",
-            f"{self.deliverables_path}/videos/social_media",
-            f"{self.deliverables_path}/videos/animations",
-            f"{self.deliverables_path}/videos/by_date/{datetime.now().strftime('%Y/%m')}"
-        ]
+    def _api_headers(self) -> Dict[str, str]:
+        # Sent to the Replicate API only, not to the video delivery host
+        return {
+            "Authorization": f"Token {self.replicate_token}",
+            "Content-Type": "application/json"
+        }
+    
+    @classmethod
+    def _ensure_directories(cls, deliverables_path: str):
+        """Ensure deliverables directories exist, once per process; the by_date
+        folder is created when a video is saved, so it follows the current month"""
+        if cls._dirs_ready:
+            return
         
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+        # Only the root needs the recursive parent walk, the category folders
+        # below it are single mkdir calls
+        root, *leaves = _VIDEO_DIRS
+        os.makedirs(f"{deliverables_path}/{root}", exist_ok=True)
+        for directory in leaves:
+            try:
+                os.mkdir(f"{deliverables_path}/{directory}")
+            except FileExistsError:
+                pass
+        cls._dirs_ready = True
     
     def _generate_file_id(self, prompt: str) -> str:
         """Generate unique file ID"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        hash_obj = hashlib.md5(f"{prompt}{timestamp}".encode())
-        unique_id = hash_obj.hexdigest()[:8]
+        # Random rather than derived from the prompt, so repeats within a second don't collide
+        unique_id = secrets.token_hex(4)
         return f"pb_video_{timestamp}_{unique_id}"
     
     def _categorize_content(self, prompt: str, video_type: str) -> str:
         """Categorize content based on prompt and type"""
-        prompt_lower = prompt.lower()
+        category = _TYPE_TO_CATEGORY.get(video_type)
+        if category:
+            return category
         
-        if video_type == "conversational" or any(word in prompt_lower for word in ['conversation', 'dialogue', 'talking', 'discussion']):
-            return 'conversational'
-        elif any(word in prompt_lower for word in ['cinematic', 'film', 'dramatic', 'movie']):
-            return 'cinematic'
-        elif any(word in prompt_lower for word in ['educational', 'tutorial', 'learning', 'explain']):
-            return 'educational'
-        elif any(word in prompt_lower for word in ['marketing', 'advertisement', 'commercial', 'product']):
-            return 'marketing'
-        elif any(word in prompt_lower for word in ['social media', 'instagram', 'tiktok', 'short']):
-            return 'social_media'
-        elif any(word in prompt_lower for word in ['animation', 'cartoon', 'animate']):
-            return 'animations'
-        else:
-            return 'cinematic'  # Default category
+        return _categorize_prompt(prompt.lower()) or 'cinematic'  # Default category
     
     async def generate_video(
         self, 
@@ -83,9 +275,13 @@ class SimpleVideoGenerator:
         resolution: str = "720p",
         style: str = "cinematic",
         video_type: str = "text_to_video",
-        model_preference: str = "auto"
+        model_preference: str = "auto",
+        return_base64: bool = False,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
-        """Generate video using cloud APIs"""
+        """Generate video using cloud APIs; the saved file path is always returned,
+        the video itself as lazily encoded base64 only when return_base64 is set.
+        An identical earlier request's video is reused unless use_cache is off."""
         
         if not self.replicate_token:
             return {
@@ -94,68 +290,165 @@ class SimpleVideoGenerator:
             }
         
         try:
-            # Select appropriate model based on requirements
-            selected_model = self._select_model(video_type, style, duration, model_preference)
-            
-            # Generate video
-            result = await self._generate_with_replicate(
-                model=selected_model,
-                prompt=prompt,
-                duration=duration,
-                fps=fps,
-                resolution=resolution,
-                style=style
-            )
-            
-            if result and result.get('success'):
-                # Save video and metadata
-                file_id = self._generate_file_id(prompt)
-                category = self._categorize_content(prompt, video_type)
-                
-                video_path = f"{self.deliverables_path}/videos/{category}/{file_id}.mp4"
-                
-                # Download and save video
-                video_url = result['video_url']
-                saved_path = await self._save_video_from_url(video_url, video_path, {
-                    "type": "video",
-                    "prompt": prompt,
-                    "duration": duration,
-                    "fps": fps,
-                    "resolution": resolution,
-                    "style": style,
-                    "video_type": video_type,
-                    "model": selected_model,
-                    "generated_at": datetime.now().isoformat(),
-                    "file_id": file_id,
-                    "category": category,
-                    "original_url": video_url
-                })
-                
-                # Convert to base64 for response
-                with open(saved_path, 'rb') as f:
-                    video_base64 = base64.b64encode(f.read()).decode('utf-8')
-                
-                return {
-                    "success": True,
-                    "video_base64": video_base64,
-                    "file_path": saved_path,
-                    "file_id": file_id,
-                    "category": category,
-                    "video_url": video_url,
-                    "message": f"Video generated successfully with {selected_model}: {category}/{file_id}.mp4"
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": result.get('error', 'Unknown error during video generation')
-                }
-                
+            async with self._open_session() as session:
+                return await self._generate_video(
+                    session, prompt, duration, fps, resolution, style, video_type, model_preference,
+                    return_base64, use_cache
+                )
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Video generation failed: {str(e)}"
             }
     
+    async def generate_batch(self, batch: List[Dict[str, Any]], concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Generate several videos concurrently, each entry holding generate_video
+        keyword arguments; the semaphore keeps within the Replicate API quota"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate_one(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_video(**request)
+        
+        return await asyncio.gather(*(generate_one(request) for request in batch))
+    
+    async def _generate_video(
+        self,
+        session: aiohttp.ClientSession,
+        prompt: str,
+        duration: int,
+        fps: int,
+        resolution: str,
+        style: str,
+        video_type: str,
+        model_preference: str,
+        return_base64: bool,
+        use_cache: bool
+    ) -> Dict[str, Any]:
+        """Generate, download and save one video over an open Replicate session"""
+        
+        # Select appropriate model based on requirements
+        selected_model = self._select_model(video_type, style, duration, model_preference)
+        
+        # Identical requests reuse the saved video instead of paying for a new prediction
+        cache_key = self._cache_key(prompt, selected_model, duration, fps, resolution, style, video_type)
+        cached = await asyncio.to_thread(self._cache_lookup, cache_key) if use_cache else None
+        if cached:
+            file_path, video_url, file_id, category = cached
+            response = {
+                "success": True,
+                "cached": True,
+                "file_path": file_path,
+                "file_id": file_id,
+                "category": category,
+                "video_url": video_url,
+                "message": f"Reused previously generated video ({selected_model}): {category}/{file_id}.mp4"
+            }
+            if return_base64:
+                response["video_base64"] = _LazyBase64(file_path, await asyncio.to_thread(os.path.getsize, file_path))
+            return response
+        
+        # Generate video
+        result = await self._generate_with_replicate(
+            session=session,
+            model=selected_model,
+            prompt=prompt,
+            duration=duration,
+            fps=fps,
+            resolution=resolution,
+            style=style
+        )
+        
+        if result and result.get('success'):
+            # Save video and metadata
+            file_id = self._generate_file_id(prompt)
+            category = self._categorize_content(prompt, video_type)
+            
+            video_path = f"{self.deliverables_path}/videos/{category}/{file_id}.mp4"
+            
+            # Download and save video
+            video_url = result['video_url']
+            saved_path, size = await self._save_video_from_url(session, video_url, video_path, {
+                "type": "video",
+                "prompt": prompt,
+                "duration": duration,
+                "fps": fps,
+                "resolution": resolution,
+                "style": style,
+                "video_type": video_type,
+                "model": selected_model,
+                "generated_at": datetime.now().isoformat(),
+                "file_id": file_id,
+                "category": category,
+                "original_url": video_url
+            })
+            
+            response = {
+                "success": True,
+                "cached": False,
+                "file_path": saved_path,
+                "file_id": file_id,
+                "category": category,
+                "video_url": video_url,
+                "message": f"Video generated successfully with {selected_model}: {category}/{file_id}.mp4"
+            }
+            if return_base64:
+                response["video_base64"] = _LazyBase64(saved_path, size)
+            
+            await asyncio.to_thread(self._cache_store, cache_key, saved_path, video_url, file_id, category)
+            return response
+        else:
+            return {
+                "success": False,
+                "error": result.get('error', 'Unknown error during video generation')
+            }
+    
+    @staticmethod
+    def _cache_key(prompt: str, model: str, duration: int, fps: int, resolution: str, style: str,
+                   video_type: str) -> str:
+        # video_type is part of the key since it decides the saved category
+        return hashlib.blake2b(
+            f"{prompt}|{model}|{duration}|{fps}|{resolution}|{style}|{video_type}".encode(), digest_size=16
+        ).hexdigest()
+    
+    def _cache_connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.cache_db_path), exist_ok=True)
+        conn = sqlite3.connect(self.cache_db_path, timeout=5)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS idx ("
+            "key TEXT PRIMARY KEY, path TEXT, url TEXT, file_id TEXT, category TEXT, ts INTEGER)"
+        )
+        return conn
+    
+    def _cache_lookup(self, key: str) -> Optional[tuple]:
+        """Saved (path, url, file_id, category) for a request key, if the file still exists"""
+        try:
+            conn = self._cache_connect()
+            try:
+                row = conn.execute("SELECT path, url, file_id, category FROM idx WHERE key=?", (key,)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+        if row and os.path.isfile(row[0]):
+            return row
+        return None
+    
+    def _cache_store(self, key: str, path: str, url: str, file_id: str, category: str):
+        try:
+            conn = self._cache_connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO idx (key, path, url, file_id, category, ts) VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, path, url, file_id, category, int(time.time()))
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            # The index is only an optimization, a failed write just means no reuse
+            pass
+    
     def _select_model(self, video_type: str, style: str, duration: int, preference: str) -> str:
         """Select appropriate model for video generation"""
         
@@ -172,6 +465,7 @@ class SimpleVideoGenerator:
     
     async def _generate_with_replicate(
         self,
+        session: aiohttp.ClientSession,
         model: str,
         prompt: str,
         duration: int,
@@ -182,139 +476,143 @@ class SimpleVideoGenerator:
         """Generate video using Replicate API"""
         
         try:
-            headers = {
-                "Authorization": f"Token {self.replicate_token}",
-                "Content-Type": "application/json"
-            }
+            headers = self._api_headers()
             
-            # Model-specific configurations
-            model_configs = {
-                "stable-video-diffusion": {
-                    "model": "stability-ai/stable-video-diffusion",
-                    "input": {
-                        "input_image": prompt,  # This would need an image for SVD
-                        "frames_per_second": fps,
-                        "motion_bucket_id": 127
-                    }
-                },
-                "zeroscope-v2": {
-                    "model": "anotherjesse/zeroscope-v2-xl",
-                    "input": {
-                        "prompt": f"{prompt}, {style} style, high quality",
-                        "num_frames": min(duration * fps, 24),  # ZeroScope limit
-                        "fps": fps,
-                        "num_inference_steps": 20,
-                        "guidance_scale": 15.0
-                    }
-                },
-                "animatediff": {
-                    "model": "lucataco/animate-diff",
-                    "input": {
-                        "prompt": f"{prompt}, {style} style, smooth animation",
-                        "num_frames": duration * fps,
-                        "guidance_scale": 7.5,
-                        "num_inference_steps": 25
-                    }
-                }
-            }
+            ref, build_input = self._MODEL_META.get(model, self._MODEL_META["zeroscope-v2"])
+            config = {"model": ref, "input": build_input(prompt, duration, fps, style)}
             
-            config = model_configs.get(model, model_configs["zeroscope-v2"])
+            webhook_token = None
+            completed = None
+            if self.webhook_base_url and replicate_webhooks is not None:
+                webhook_token, completed = replicate_webhooks.register()
+                config["webhook"] = replicate_webhooks.webhook_url(self.webhook_base_url, webhook_token)
+                config["webhook_events_filter"] = ["completed"]
             
-            # Start prediction
-            response = requests.post(
-                f"https://api.replicate.com/v1/predictions",
-                headers=headers,
-                json=config,
-                timeout=30
-            )
+            try:
+                return await self._run_prediction(session, headers, config, completed)
+            finally:
+                if webhook_token is not None:
+                    replicate_webhooks.discard(webhook_token)
             
-            if response.status_code != 201:
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"API request failed: {str(e)}"
+            }
+    
+    async def _run_prediction(
+        self,
+        session: aiohttp.ClientSession,
+        headers: Dict[str, str],
+        config: Dict[str, Any],
+        completed: Optional[asyncio.Future]
+    ) -> Dict[str, Any]:
+        """Start a prediction and wait for its outcome, woken by the completion
+        webhook when one is registered and polling the status otherwise"""
+        
+        # Start prediction
+        async with session.post(
+            "https://api.replicate.com/v1/predictions",
+            headers=headers,
+            json=config
+        ) as response:
+            if response.status != 201:
                 return {
                     "success": False,
-                    "error": f"Failed to start prediction: {response.status_code} - {response.text}"
+                    "error": f"Failed to start prediction: {response.status} - {await response.text()}"
                 }
             
-            prediction = response.json()
-            prediction_id = prediction["id"]
+            prediction = await response.json()
+        prediction_id = prediction["id"]
+        
+        # Poll for completion, quickly at first so short jobs are picked up soon
+        # after they finish, then backing off to every 8 seconds. With a webhook
+        # the wait ends as soon as it arrives and polls only cover a lost callback.
+        deadline = time.monotonic() + 600  # 10 minutes max wait
+        attempt = 0
+        while time.monotonic() < deadline:
+            if completed is None:
+                await asyncio.sleep(min(8.0, 0.5 * 1.5 ** min(attempt, 7)))
+            else:
+                await asyncio.wait((completed,), timeout=min(60.0, max(0.0, deadline - time.monotonic())))
+            attempt += 1
             
-            # Poll for completion
-            max_attempts = 120  # 10 minutes max wait
-            for attempt in range(max_attempts):
-                await asyncio.sleep(5)
-                
-                status_response = requests.get(
+            if completed is not None and completed.done():
+                # A webhook is only delivered once, later checks go back to polling
+                status_data = completed.result()
+                completed = None
+            else:
+                async with session.get(
                     f"https://api.replicate.com/v1/predictions/{prediction_id}",
                     headers=headers,
-                    timeout=10
-                )
-                
-                if status_response.status_code != 200:
-                    continue
-                
-                status_data = status_response.json()
-                
-                if status_data["status"] == "succeeded":
-                    video_url = status_data["output"]
-                    if isinstance(video_url, list):
-                        video_url = video_url[0]
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as status_response:
+                    if status_response.status != 200:
+                        continue
                     
-                    return {
-                        "success": True,
-                        "video_url": video_url,
-                        "prediction_id": prediction_id
-                    }
-                
-                elif status_data["status"] == "failed":
-                    error_msg = status_data.get("error", "Unknown error")
-                    return {
-                        "success": False,
-                        "error": f"Video generation failed: {error_msg}"
-                    }
+                    status_data = await status_response.json()
+            
+            if status_data["status"] == "succeeded":
+                video_url = status_data["output"]
+                if isinstance(video_url, list):
+                    video_url = video_url[0]
                 
-                elif status_data["status"] in ["starting", "processing"]:
-                    continue
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Unexpected status: {status_data['status']}"
-                    }
+                return {
+                    "success": True,
+                    "video_url": video_url,
+                    "prediction_id": prediction_id
+                }
             
-            return {
-                "success": False,
-                "error": "Video generation timed out after 10 minutes"
-            }
+            elif status_data["status"] == "failed":
+                error_msg = status_data.get("error", "Unknown error")
+                return {
+                    "success": False,
+                    "error": f"Video generation failed: {error_msg}"
+                }
             
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"API request failed: {str(e)}"
-            }
+            elif status_data["status"] in ["starting", "processing"]:
+                continue
+            else:
+                return {
+                    "success": False,
+                    "error": f"Unexpected status: {status_data['status']}"
+                }
+        
+        return {
+            "success": False,
+            "error": "Video generation timed out after 10 minutes"
+        }
     
-    async def _save_video_from_url(self, video_url: str, file_path: str, metadata: Dict) -> str:
-        """Download and save video from URL"""
+    async def _save_video_from_url(self, session: aiohttp.ClientSession, video_url: str, file_path: str, metadata: Dict) -> tuple[str, int]:
+        """Download and save video from URL, returning the saved path and its size"""
         try:
-            # Download video
-            response = requests.get(video_url, timeout=60)
-            response.raise_for_status()
+            # Stream the video to disk; the timeout bounds stalls, not total download time
+            async with session.get(
+                video_url,
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=60)
+            ) as response:
+                response.raise_for_status()
+                size = 0
+                # File writes run in a worker thread so a slow disk doesn't stall
+                # other generations sharing the event loop
+                f = await asyncio.to_thread(open, file_path, 'wb')
+                try:
+                    async for chunk in response.content.iter_chunked(1 << 20):
+                        await asyncio.to_thread(f.write, chunk)
+                        size += len(chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
             
-            # Save video
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-            
-            # Save metadata
-            metadata_path = file_path.replace('.mp4', '.json')
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
-            
-            # Create backup in date folder
+            # Backup in date folder, a hard link to the saved file where possible
             date_folder = f"{self.deliverables_path}/videos/by_date/{datetime.now().strftime('%Y/%m')}"
-            os.makedirs(date_folder, exist_ok=True)
             backup_path = os.path.join(date_folder, os.path.basename(file_path))
+            await asyncio.to_thread(_link_or_copy, file_path, backup_path)
             
-            with open(backup_path, 'wb') as f:
-                f.write(response.content)
+            # Save metadata
+            metadata_path = file_path.replace('.mp4', '.json')
+            await asyncio.to_thread(_write_metadata, metadata_path, metadata)
             
-            return file_path
+            return file_path, size
         
         except Exception as e:
             raise Exception(f"Failed to save video: {str(e)}")
@@ -328,30 +626,19 @@ class SimpleVideoGenerator:
             }
         
         try:
-            headers = {
-                "Authorization": f"Token {self.replicate_token}",
-                "Content-Type": "application/json"
-            }
-            
             # Test API connection
-            response = requests.get(
+            response = _get_http_session().get(
                 "https://api.replicate.com/v1/predictions",
-                headers=headers,
+                headers=self._api_headers(),
                 timeout=10
             )
             
             if response.status_code == 200:
                 return {
                     "available": True,
-                    "models": ["zeroscope-v2", "stable-video-diffusion", "animatediff"],
+                    "models": list(_MODELS),
                     "deliverables_path": self.deliverables_path,
-                    "features": [
-                        "Text-to-video generation",
-                        "Multiple video styles",
-                        "Customizable duration and FPS",
-                        "Organized file storage",
-                        "Automatic categorization"
-                    ]
+                    "features": list(_FEATURES)
                 }
             else:
                 return {
@@ -365,34 +652,29 @@ class SimpleVideoGenerator:
                 "error": f"Connection error: {str(e)}"
             }
 
-def simple_video_generator(operation: str = "status", **kwargs) -> str:
-    """
-    Simple Video Generator for Pareng Boyong
-    
-    Operations:
-    - status: Check service availability
-    - generate: Generate video (prompt, duration, fps, resolution, style, video_type)
-    """
-    
-    generator = SimpleVideoGenerator()
-    
-    try:
-        if operation == "status":
-            status = generator.get_service_status()
-            
-            if status["available"]:
-                return f"""
+_MODELS = ("zeroscope-v2", "stable-video-diffusion", "animatediff")
+_FEATURES = (
+    "Text-to-video generation",
+    "Multiple video styles",
+    "Customizable duration and FPS",
+    "Organized file storage",
+    "Automatic categorization",
+)
+_FEATURES_BLOCK = "\n".join(f"- {feature}" for feature in _FEATURES)
+
+# Report templates, filled in with format_map at call time
+_STATUS_OK_TEMPLATE = """
 # 🎬 **Simple Video Generator - Service Status**
 
 ## ✅ **Service Available**
-- **Models**: {', '.join(status['models'])}
-- **Features**: {len(status['features'])} capabilities
+- **Models**: {models}
+- **Features**: {n_features} capabilities
 
 ## 📁 **Storage Location**
-**Deliverables**: `{status['deliverables_path']}`
+**Deliverables**: `{deliverables_path}`
 
 ## 🎯 **Capabilities**
-{chr(10).join(f"- {feature}" for feature in status['features'])}
+{features_block}
 
 ## 📊 **Available Models**
 - **ZeroScope V2**: High-quality text-to-video (up to 3 seconds)
@@ -404,12 +686,12 @@ def simple_video_generator(operation: str = "status", **kwargs) -> str:
 
 ✅ **Ready for video generation!**
 """
-            else:
-                return f"""
+
+_STATUS_ERROR_TEMPLATE = """
 # ❌ **Simple Video Generator - Service Error**
 
 **Status**: Unavailable
-**Error**: {status['error']}
+**Error**: {error}
 
 ## 🔧 **Troubleshooting**
 1. Check if REPLICATE_API_TOKEN is set in .env file
@@ -417,56 +699,36 @@ def simple_video_generator(operation: str = "status", **kwargs) -> str:
 3. Check internet connection
 4. Try again in a few minutes
 
-**Current Token**: {'✅ Set' if generator.replicate_token else '❌ Missing'}
+**Current Token**: {token_state}
 """
-        
-        elif operation == "generate":
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(
-                    generator.generate_video(
-                        prompt=kwargs.get('prompt', 'A beautiful landscape'),
-                        duration=kwargs.get('duration', 3),
-                        fps=kwargs.get('fps', 8),
-                        resolution=kwargs.get('resolution', '720p'),
-                        style=kwargs.get('style', 'cinematic'),
-                        video_type=kwargs.get('video_type', 'text_to_video'),
-                        model_preference=kwargs.get('model_preference', 'auto')
-                    )
-                )
-            finally:
-                loop.close()
-            
-            if result['success']:
-                return f"""
+
+_GENERATE_OK_TEMPLATE = """
 # 🎬 **Video Generated Successfully!**
 
-**File ID**: `{result['file_id']}`
-**Location**: `{result['file_path']}`
-**Category**: {result['category']}
+**File ID**: `{file_id}`
+**Location**: `{file_path}`
+**Category**: {category}
 
 ## 📋 **Generation Details**
-- **Prompt**: "{kwargs.get('prompt', 'A beautiful landscape')}"
-- **Duration**: {kwargs.get('duration', 3)} seconds
-- **FPS**: {kwargs.get('fps', 8)}
-- **Resolution**: {kwargs.get('resolution', '720p')}
-- **Style**: {kwargs.get('style', 'cinematic')}
+- **Prompt**: "{prompt}"
+- **Duration**: {duration} seconds
+- **FPS**: {fps}
+- **Resolution**: {resolution}
+- **Style**: {style}
 
 ## 🌐 **Access**
-- **Local File**: `{result['file_path']}`
-- **Original URL**: [View Video]({result['video_url']})
+- **Local File**: `{file_path}`
+- **Original URL**: [View Video]({video_url})
 
-✅ {result['message']}
+✅ {message}
 
 💡 **Tip**: Video is automatically saved to organized folders and backed up by date!
 """
-            else:
-                return f"""
+
+_GENERATE_ERROR_TEMPLATE = """
 # ❌ **Video Generation Failed**
 
-**Error**: {result['error']}
+**Error**: {error}
 
 ## 🔧 **Possible Solutions**
 1. Check your prompt for content policy violations
@@ -475,11 +737,10 @@ def simple_video_generator(operation: str = "status", **kwargs) -> str:
 4. Check internet connection
 5. Try again with a simpler prompt
 
-**Timestamp**: {datetime.now().isoformat()}
+**Timestamp**: {timestamp}
 """
-        
-        else:
-            return f"""
+
+_UNKNOWN_OPERATION_TEMPLATE = """
 # ❌ **Unknown Operation**
 
 **Operation**: {operation}
@@ -503,6 +764,85 @@ simple_video_generator(
 )
 ```
 """
+
+def _render_generation(result: Dict[str, Any], params: Dict[str, Any]) -> str:
+    """Render one generation result as a markdown report"""
+    if result['success']:
+        return _GENERATE_OK_TEMPLATE.format_map({
+            "file_id": result['file_id'],
+            "file_path": result['file_path'],
+            "category": result['category'],
+            "prompt": params['prompt'],
+            "duration": params['duration'],
+            "fps": params['fps'],
+            "resolution": params['resolution'],
+            "style": params['style'],
+            "video_url": result['video_url'],
+            "message": result['message']
+        })
+    return _GENERATE_ERROR_TEMPLATE.format_map({
+        "error": result['error'],
+        "timestamp": datetime.now().isoformat()
+    })
+
+def simple_video_generator(operation: str = "status", **kwargs) -> str:
+    """
+    Simple Video Generator for Pareng Boyong
+    
+    Operations:
+    - status: Check service availability
+    - generate: Generate video (prompt, duration, fps, resolution, style, video_type);
+      a list of prompts is generated concurrently (concurrency, default 4);
+      use_cache=False generates a new video even for a repeated request
+    """
+    
+    generator = SimpleVideoGenerator()
+    
+    try:
+        if operation == "status":
+            status = generator.get_service_status()
+            
+            if status["available"]:
+                return _STATUS_OK_TEMPLATE.format_map({
+                    "models": ', '.join(status['models']),
+                    "n_features": len(status['features']),
+                    "deliverables_path": status['deliverables_path'],
+                    "features_block": _FEATURES_BLOCK
+                })
+            else:
+                return _STATUS_ERROR_TEMPLATE.format_map({
+                    "error": status['error'],
+                    "token_state": '✅ Set' if generator.replicate_token else '❌ Missing'
+                })
+        
+        elif operation == "generate":
+            params = {
+                "prompt": kwargs.get('prompt', 'A beautiful landscape'),
+                "duration": kwargs.get('duration', 3),
+                "fps": kwargs.get('fps', 8),
+                "resolution": kwargs.get('resolution', '720p'),
+                "style": kwargs.get('style', 'cinematic'),
+                "video_type": kwargs.get('video_type', 'text_to_video'),
+                "model_preference": kwargs.get('model_preference', 'auto'),
+                "return_base64": kwargs.get('return_base64', False),
+                "use_cache": kwargs.get('use_cache', True)
+            }
+            
+            # A list of prompts is generated as one concurrent batch sharing the other settings
+            if isinstance(params["prompt"], (list, tuple)):
+                batch = [{**params, "prompt": prompt} for prompt in params["prompt"]]
+                results = asyncio.run(
+                    generator.generate_batch(batch, concurrency=kwargs.get('concurrency', 4))
+                )
+                return "\n---\n".join(
+                    _render_generation(result, request) for result, request in zip(results, batch)
+                )
+            
+            result = asyncio.run(generator.generate_video(**params))
+            return _render_generation(result, params)
+        
+        else:
+            return _UNKNOWN_OPERATION_TEMPLATE.format(operation=operation)
     
     except Exception as e:
         return f"❌ **Simple Video Generator Error**: {str(e)}"
\ No newline at end of file
@@ -1,13 +1,82 @@
 import os
+import re
 import sys
+import threading
 import psutil
 import docker
 import subprocess
 import json
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
+# A full health check forks probes and makes network calls, so operations issued
+# back to back share one snapshot
+HEALTH_CACHE_TTL = 5.0
+CONTAINER_CACHE_TTL = 2.0
+# Shortest window a CPU usage reading is taken over
+CPU_MIN_SAMPLE = 0.1
+
+# Containers belonging to Pareng Boyong, matched as parts of the container name
+_CONTAINER_NAMES = ('agent-zero', 'pareng-boyong')
+# Command line fragments of processes recorded in a backup
+_BACKUP_PROCESS_KEYWORDS = ('pareng-boyong', 'agent-zero', 'run_ui')
+
+# Critical services and their health endpoint and probe timeout in seconds
+_SERVICE_URLS = {
+    'agent_zero_ui': ('https://ai.innovatehub.ph/health', 10),
+    'dashboard_backend': ('http://localhost:5000/api/health', 5),
+    'searxng': ('http://localhost:55510', 5),
+}
+
+# Action patterns in priority order; the first listed pattern found is reported
+HIGH_RISK_PATTERNS = (
+    'kill -9', 'pkill', 'killall',
+    'docker stop', 'docker kill', 'docker rm',
+    'systemctl stop', 'systemctl kill',
+    'shutdown', 'reboot', 'halt',
+    'rm -rf', 'rm -f /root/projects/pareng-boyong',
+    'chmod 000', 'chown root:root',
+    'iptables -F', 'ufw disable',
+    'pip uninstall -y', 'npm uninstall',
+    'git reset --hard', 'git clean -fd'
+)
+
+MEDIUM_RISK_PATTERNS = (
+    'docker restart', 'systemctl restart',
+    'pip install', 'npm install',
+    'chmod', 'chown',
+    'mv /root/projects/pareng-boyong',
+    'cp -r /root/projects/pareng-boyong',
+    'git pull', 'git checkout',
+    'python -m pip', 'apt-get remove'
+)
+
+def _compile_patterns(patterns) -> re.Pattern:
+    # A lookahead alternation reports a match at every position in one scan,
+    # preferring the earliest listed pattern starting there
+    return re.compile(f"(?=({'|'.join(map(re.escape, patterns))}))")
+
+_HIGH_RISK_RE = _compile_patterns(HIGH_RISK_PATTERNS)
+_MEDIUM_RISK_RE = _compile_patterns(MEDIUM_RISK_PATTERNS)
+_HIGH_RISK_PRIORITY = {pattern: rank for rank, pattern in enumerate(HIGH_RISK_PATTERNS)}
+_MEDIUM_RISK_PRIORITY = {pattern: rank for rank, pattern in enumerate(MEDIUM_RISK_PATTERNS)}
+
+def _first_listed_match(regex: re.Pattern, priority: Dict[str, int], text: str) -> Optional[str]:
+    """The earliest listed pattern occurring anywhere in text"""
+    best = None
+    for match in regex.finditer(text):
+        pattern = match.group(1)
+        if best is None or priority[pattern] < priority[best]:
+            best = pattern
+            if priority[best] == 0:
+                break
+    return best
+
 class SystemSelfAwareness:
     """
     Pareng Boyong Self-Awareness and Protection System
@@ -16,17 +85,40 @@ class SystemSelfAwareness:
     and awareness of actions that could affect system stability.
     """
     
+    critical_processes = (
+        'agent-zero-dev',  # Main container
+        'run_ui.py',       # UI process
+        'nginx',           # Web server
+        'docker',          # Container management
+    )
+    critical_ports = (55080, 55022, 55510, 5000, 27017, 6379)
+    safe_memory_threshold = 0.85  # 85% memory usage threshold
+    safe_cpu_threshold = 0.90     # 90% CPU usage threshold
+    
+    BACKUP_DIR = '/root/pareng_boyong_backup'
+    # Set once the backup folder exists, so later backups skip the makedirs call
+    _backup_dir_ready = False
+    
+    _instance: Optional["SystemSelfAwareness"] = None
+    _instance_lock = threading.Lock()
+    
     def __init__(self):
         self.system_info = self._get_system_info()
-        self.critical_processes = [
-            'agent-zero-dev',  # Main container
-            'run_ui.py',       # UI process
-            'nginx',           # Web server
-            'docker',          # Container management
-        ]
-        self.critical_ports = [55080, 55022, 55510, 5000, 27017, 6379]
-        self.safe_memory_threshold = 0.85  # 85% memory usage threshold
-        self.safe_cpu_threshold = 0.90     # 90% CPU usage threshold
+        self._health_cache: Optional[tuple[float, Dict[str, Any]]] = None
+        self._docker = None
+        self._container_cache: Optional[tuple[float, list]] = None
+        # Prime psutil's CPU counters so later readings cover the time since the last one
+        psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
+    
+    @classmethod
+    def get(cls) -> "SystemSelfAwareness":
+        """Shared instance, so system info and health snapshots persist across tool calls"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
         
     def _get_system_info(self) -> Dict[str, Any]:
         """Get comprehensive system information"""
@@ -42,7 +134,9 @@ class SystemSelfAwareness:
             'container_runtime': self._detect_container_runtime()
         }
     
-    def _detect_container_runtime(self) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _detect_container_runtime() -> str:
         """Detect if running inside container"""
         if os.path.exists('/.dockerenv'):
             return 'docker'
@@ -52,84 +146,62 @@ class SystemSelfAwareness:
                     return 'docker'
         return 'host'
     
-    def assess_action_risk(self, action: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    def assess_action_risk(self, action: str, context: Dict[str, Any] = None,
+                           include_state: bool = False) -> Dict[str, Any]:
         """
         Assess the risk level of a proposed action
         
+        Actions matching no risk pattern are only checked against a recent health
+        snapshot, if one exists, unless include_state asks for a full probe.
         Returns risk assessment with recommendations
         """
         risk_level = "low"
         warnings = []
         recommendations = []
         
-        # High-risk patterns
-        high_risk_patterns = [
-            'kill -9', 'pkill', 'killall',
-            'docker stop', 'docker kill', 'docker rm',
-            'systemctl stop', 'systemctl kill',
-            'shutdown', 'reboot', 'halt',
-            'rm -rf', 'rm -f /root/projects/pareng-boyong',
-            'chmod 000', 'chown root:root',
-            'iptables -F', 'ufw disable',
-            'pip uninstall -y', 'npm uninstall',
-            'git reset --hard', 'git clean -fd'
-        ]
-        
-        # Medium-risk patterns  
-        medium_risk_patterns = [
-            'docker restart', 'systemctl restart',
-            'pip install', 'npm install',
-            'chmod', 'chown',
-            'mv /root/projects/pareng-boyong',
-            'cp -r /root/projects/pareng-boyong',
-            'git pull', 'git checkout',
-            'python -m pip', 'apt-get remove'
-        ]
-        
         action_lower = action.lower()
         
         # Check for high-risk patterns
-        for pattern in high_risk_patterns:
-            if pattern in action_lower:
-                risk_level = "high"
-                warnings.append(f"High-risk action detected: {pattern}")
-                
-                if 'kill' in pattern and any(proc in action_lower for proc in ['agent-zero', 'run_ui', 'nginx']):
-                    warnings.append("This action could terminate critical Pareng Boyong processes")
-                    recommendations.append("Consider using graceful shutdown methods instead")
-                
-                if 'docker' in pattern and 'agent-zero' in action_lower:
-                    warnings.append("This action affects the main Agent Zero container")
-                    recommendations.append("Ensure you have a recovery plan before proceeding")
-                
-                if 'rm' in pattern and 'pareng-boyong' in action_lower:
-                    warnings.append("This action could delete critical system files")
-                    recommendations.append("Create a backup before proceeding")
-                
-                break
+        pattern = _first_listed_match(_HIGH_RISK_RE, _HIGH_RISK_PRIORITY, action_lower)
+        if pattern:
+            risk_level = "high"
+            warnings.append(f"High-risk action detected: {pattern}")
+            
+            if 'kill' in pattern and any(proc in action_lower for proc in ['agent-zero', 'run_ui', 'nginx']):
+                warnings.append("This action could terminate critical Pareng Boyong processes")
+                recommendations.append("Consider using graceful shutdown methods instead")
+            
+            if 'docker' in pattern and 'agent-zero' in action_lower:
+                warnings.append("This action affects the main Agent Zero container")
+                recommendations.append("Ensure you have a recovery plan before proceeding")
+            
+            if 'rm' in pattern and 'pareng-boyong' in action_lower:
+                warnings.append("This action could delete critical system files")
+                recommendations.append("Create a backup before proceeding")
         
         # Check for medium-risk patterns if not high-risk
-        if risk_level != "high":
-            for pattern in medium_risk_patterns:
-                if pattern in action_lower:
-                    risk_level = "medium"
-                    warnings.append(f"Medium-risk action detected: {pattern}")
-                    
-                    if 'restart' in pattern:
-                        recommendations.append("This may cause temporary service interruption")
-                    
-                    if 'install' in pattern:
-                        recommendations.append("Monitor system resources during installation")
-                    
-                    break
+        else:
+            pattern = _first_listed_match(_MEDIUM_RISK_RE, _MEDIUM_RISK_PRIORITY, action_lower)
+            if pattern:
+                risk_level = "medium"
+                warnings.append(f"Medium-risk action detected: {pattern}")
+                
+                if 'restart' in pattern:
+                    recommendations.append("This may cause temporary service interruption")
+                
+                if 'install' in pattern:
+                    recommendations.append("Monitor system resources during installation")
         
         # Check current system state
-        system_state = self.get_system_health()
-        if system_state['memory_usage'] > 0.8:
+        if risk_level != "low" or include_state:
+            system_state = self.get_system_health(use_cache=True)
+        else:
+            system_state = self._cached_health() or {'overall_health': 'unknown'}
+        if system_state.get('memory_usage', 0) > 0.8:
             warnings.append("High memory usage detected - action may cause instability")
             risk_level = "high" if risk_level == "low" else risk_level
         
-        if system_state['cpu_usage'] > 0.9:
+        if system_state.get('cpu_usage', 0) > 0.9:
             warnings.append("High CPU usage detected - action may cause system freeze")
             risk_level = "high" if risk_level == "low" else risk_level
         
@@ -141,23 +213,41 @@ class SystemSelfAwareness:
             'safe_to_proceed': risk_level in ["low", "medium"] and len(warnings) <= 2
         }
     
-    def get_system_health(self) -> Dict[str, Any]:
-        """Get current system health status"""
+    def get_system_health(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Get current system health status, reusing a snapshot up to
+        HEALTH_CACHE_TTL seconds old unless use_cache is off"""
+        if use_cache:
+            health = self._cached_health()
+            if health is not None:
+                return health
+        
+        health = self._probe_system_health()
+        if 'error' not in health:
+            self._health_cache = (time.monotonic(), health)
+        return health
+    
+    def _cached_health(self) -> Optional[Dict[str, Any]]:
+        """The last health snapshot, if it is still fresh"""
+        if self._health_cache is not None:
+            taken_at, health = self._health_cache
+            if time.monotonic() - taken_at < HEALTH_CACHE_TTL:
+                return health
+        return None
+    
+    def _probe_system_health(self) -> Dict[str, Any]:
+        """Run every health probe"""
         try:
             # System resources
             memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = self._cpu_percent()
             disk = psutil.disk_usage('/')
             
             # Process information
-            critical_processes_status = {}
-            for proc_name in self.critical_processes:
-                critical_processes_status[proc_name] = self._check_process_running(proc_name)
+            critical_processes_status = self._scan_processes()
             
             # Port availability
-            port_status = {}
-            for port in self.critical_ports:
-                port_status[port] = self._check_port_listening(port)
+            listening = self._listening_ports()
+            port_status = {port: port in listening for port in self.critical_ports}
             
             # Docker containers
             container_status = self._get_container_status()
@@ -188,76 +278,120 @@ class SystemSelfAwareness:
                 'overall_health': 'unknown'
             }
     
-    def _check_process_running(self, process_name: str) -> bool:
-        """Check if a specific process is running"""
+    def _cpu_percent(self) -> float:
+        """CPU usage since the previous reading, without sleeping for a sample
+        window unless the previous reading was only moments ago"""
+        if time.monotonic() - self._cpu_sampled_at < CPU_MIN_SAMPLE:
+            cpu_percent = psutil.cpu_percent(interval=CPU_MIN_SAMPLE)
+        else:
+            cpu_percent = psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
+        return cpu_percent
+    
+    def _scan_processes(self) -> Dict[str, bool]:
+        """Check which critical processes are running in one pass over the
+        process table, matching names against the full command line like pgrep -f"""
+        results = {name: False for name in self.critical_processes}
+        remaining = set(results)
         try:
-            result = subprocess.run(
-                ['pgrep', '-f', process_name], 
-                capture_output=True, text=True
-            )
-            return result.returncode == 0
-        except:
-            return False
+            # process_iter fetches the requested attrs for each process in one go
+            for proc in psutil.process_iter(['name', 'cmdline']):
+                hay = f"{proc.info['name'] or ''} {' '.join(proc.info['cmdline'] or [])}"
+                for name in [name for name in remaining if name in hay]:
+                    results[name] = True
+                    remaining.discard(name)
+                if not remaining:
+                    break
+        except Exception:
+            pass
+        return results
     
-    def _check_port_listening(self, port: int) -> bool:
-        """Check if a port is listening"""
+    def _listening_ports(self) -> set:
+        """Get every listening TCP port in one query"""
+        try:
+            return {
+                conn.laddr.port
+                for conn in psutil.net_connections(kind='tcp')
+                if conn.status == psutil.CONN_LISTEN and conn.laddr
+            }
+        except (psutil.AccessDenied, PermissionError):
+            pass
+        
+        # Not permitted to read the socket table, ask ss once instead
         try:
             result = subprocess.run(
-                ['netstat', '-tlnp'], 
-                capture_output=True, text=True
+                ['ss', '-tlnH'],
+                capture_output=True, text=True, timeout=5
             )
-            return f':{port}' in result.stdout
+            ports = set()
+            for line in result.stdout.splitlines():
+                fields = line.split()
+                if len(fields) >= 4:
+                    port = fields[3].rpartition(':')[2]
+                    if port.isdigit():
+                        ports.add(int(port))
+            return ports
         except:
-            return False
+            return set()
+    
+    def _docker_client(self):
+        """Docker client, connected on first use and reused afterwards"""
+        if self._docker is None:
+            self._docker = docker.from_env()
+        return self._docker
+    
+    def _list_containers(self) -> list:
+        """Pareng Boyong containers, listed at most every CONTAINER_CACHE_TTL seconds;
+        the daemon does the name filtering so other containers aren't transferred"""
+        if self._container_cache is not None:
+            listed_at, containers = self._container_cache
+            if time.monotonic() - listed_at < CONTAINER_CACHE_TTL:
+                return containers
+        
+        try:
+            containers = [
+                container
+                for container in self._docker_client().containers.list(
+                    all=True, filters={'name': list(_CONTAINER_NAMES)}
+                )
+                if any(name in container.name for name in _CONTAINER_NAMES)
+            ]
+        except Exception:
+            # Reconnect next time in case the daemon was restarted
+            self._docker = None
+            raise
+        self._container_cache = (time.monotonic(), containers)
+        return containers
     
     def _get_container_status(self) -> Dict[str, str]:
         """Get Docker container status"""
         try:
-            client = docker.from_env()
-            containers = client.containers.list(all=True)
-            status = {}
-            for container in containers:
-                if any(name in container.name for name in ['agent-zero', 'pareng-boyong']):
-                    status[container.name] = container.status
-            return status
+            return {container.name: container.status for container in self._list_containers()}
         except:
             return {'error': 'Docker not accessible'}
     
     def _check_service_health(self) -> Dict[str, Any]:
-        """Check health of critical services"""
-        services = {}
-        
-        # Check Agent Zero UI
-        try:
-            result = subprocess.run(
-                ['curl', '-s', 'https://ai.innovatehub.ph/health'], 
-                capture_output=True, text=True, timeout=10
-            )
-            services['agent_zero_ui'] = 'healthy' if result.returncode == 0 else 'unhealthy'
-        except:
-            services['agent_zero_ui'] = 'unknown'
-        
-        # Check Dashboard Backend
+        """Check health of critical services, probing them concurrently"""
+        with ThreadPoolExecutor(max_workers=len(_SERVICE_URLS)) as executor:
+            futures = {
+                name: executor.submit(self._probe_http, url, timeout)
+                for name, (url, timeout) in _SERVICE_URLS.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+    
+    @staticmethod
+    def _probe_http(url: str, timeout: float) -> str:
+        """Any HTTP response counts as healthy, a refused or failed connection as
+        unhealthy and a timeout as unknown"""
         try:
-            result = subprocess.run(
-                ['curl', '-s', 'http://localhost:5000/api/health'], 
-                capture_output=True, text=True, timeout=5
-            )
-            services['dashboard_backend'] = 'healthy' if result.returncode == 0 else 'unhealthy'
+            with urllib.request.urlopen(url, timeout=timeout):
+                return 'healthy'
+        except urllib.error.HTTPError:
+            return 'healthy'
+        except urllib.error.URLError as e:
+            return 'unknown' if isinstance(e.reason, TimeoutError) else 'unhealthy'
         except:
-            services['dashboard_backend'] = 'unknown'
-        
-        # Check SearXNG
-        try:
-            result = subprocess.run(
-                ['curl', '-s', 'http://localhost:55510'], 
-                capture_output=True, text=True, timeout=5
-            )
-            services['searxng'] = 'healthy' if result.returncode == 0 else 'unhealthy'
-        except:
-            services['searxng'] = 'unknown'
-        
-        return services
+            return 'unknown'
     
     def _calculate_overall_health(self, memory_usage: float, cpu_usage: float, 
                                  processes: Dict, services: Dict) -> str:
@@ -300,37 +434,44 @@ class SystemSelfAwareness:
         """Create a quick system backup for recovery"""
         backup_info = {
             'timestamp': datetime.now().isoformat(),
-            'system_state': self.get_system_health(),
+            'system_state': self.get_system_health(use_cache=False),
             'running_processes': [],
             'docker_containers': [],
-            'backup_location': '/root/pareng_boyong_backup'
+            'backup_location': self.BACKUP_DIR
         }
         
         try:
-            # Get running processes
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                if any(keyword in ' '.join(proc.info['cmdline'] or []) 
-                      for keyword in ['pareng-boyong', 'agent-zero', 'run_ui']):
-                    backup_info['running_processes'].append(proc.info)
+            # Get running processes; only the command line is read for every
+            # process, the name just for the ones being recorded
+            for proc in psutil.process_iter(['cmdline']):
+                cmdline = ' '.join(proc.info['cmdline'] or ())
+                if any(keyword in cmdline for keyword in _BACKUP_PROCESS_KEYWORDS):
+                    try:
+                        backup_info['running_processes'].append({
+                            'cmdline': proc.info['cmdline'],
+                            'pid': proc.pid,
+                            'name': proc.name()
+                        })
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
             
             # Get container info
             try:
-                client = docker.from_env()
-                containers = client.containers.list(all=True)
-                for container in containers:
-                    if any(name in container.name for name in ['agent-zero', 'pareng-boyong']):
-                        backup_info['docker_containers'].append({
-                            'name': container.name,
-                            'status': container.status,
-                            'image': container.image.tags[0] if container.image.tags else 'unknown'
-                        })
+                for container in self._list_containers():
+                    backup_info['docker_containers'].append({
+                        'name': container.name,
+                        'status': container.status,
+                        'image': container.image.tags[0] if container.image.tags else 'unknown'
+                    })
             except:
                 backup_info['docker_containers'] = ['docker_unavailable']
             
             # Save backup info
-            os.makedirs('/root/pareng_boyong_backup', exist_ok=True)
-            with open('/root/pareng_boyong_backup/system_state.json', 'w') as f:
-                json.dump(backup_info, f, indent=2)
+            if not SystemSelfAwareness._backup_dir_ready:
+                os.makedirs(self.BACKUP_DIR, exist_ok=True)
+                SystemSelfAwareness._backup_dir_ready = True
+            with open(os.path.join(self.BACKUP_DIR, 'system_state.json'), 'wb') as f:
+                f.write(json.dumps(backup_info, separators=(',', ':')).encode())
             
             return backup_info
         except Exception as e:
@@ -367,6 +508,12 @@ class SystemSelfAwareness:
         return recommendations
 
 
+_SERVICE_STATUS_LABELS = {'healthy': '✅ Healthy', 'unhealthy': '❌ Unhealthy'}
+_UNKNOWN_STATUS_LABEL = '❓ Unknown'
+_PROCESS_STATUS_LABELS = {True: '✅ Running', False: '❌ Not Running'}
+_RISK_EMOJI = {"low": "✅", "medium": "⚠️", "high": "🚨"}
+
+
 def system_self_awareness(action: str = "", operation: str = "health_check") -> str:
     """
     Pareng Boyong System Self-Awareness Tool
@@ -378,11 +525,23 @@ def system_self_awareness(action: str = "", operation: str = "health_check") ->
     - recovery: Get recovery recommendations
     """
     
-    awareness = SystemSelfAwareness()
+    awareness = SystemSelfAwareness.get()
     
     try:
         if operation == "health_check":
             health = awareness.get_system_health()
+            # Built outside the f-string, which can't contain "\n" before Python 3.12
+            services_block = "\n".join([
+                f"- **{service}**: {_SERVICE_STATUS_LABELS.get(status, _UNKNOWN_STATUS_LABEL)}"
+                for service, status in health['services'].items()
+            ])
+            processes_block = "\n".join([
+                f"- **{proc}**: {_PROCESS_STATUS_LABELS[bool(status)]}"
+                for proc, status in health['critical_processes'].items()
+            ])
+            containers_block = "\n".join([
+                f"- **{name}**: {status}" for name, status in health['containers'].items()
+            ]) if isinstance(health['containers'], dict) else "❌ Docker unavailable"
             return f"""
 # 🏥 **Pareng Boyong System Health Report**
 
@@ -392,13 +551,13 @@ def system_self_awareness(action: str = "", operation: str = "health_check") ->
 - **Disk**: {health['disk_usage']*100:.1f}% ({health['disk_free_gb']:.1f}GB free)
 
 ## 🔧 **Critical Services**
-{chr(10).join(f"- **{service}**: {'✅ Healthy' if status == 'healthy' else '❌ Unhealthy' if status == 'unhealthy' else '❓ Unknown'}" for service, status in health['services'].items())}
+{services_block}
 
 ## 🖥️ **System Processes**
-{chr(10).join(f"- **{proc}**: {'✅ Running' if status else '❌ Not Running'}" for proc, status in health['critical_processes'].items())}
+{processes_block}
 
 ## 🐳 **Docker Containers**
-{chr(10).join(f"- **{name}**: {status}" for name, status in health['containers'].items()) if isinstance(health['containers'], dict) else "❌ Docker unavailable"}
+{containers_block}
 
 ## 🎯 **Overall Health**: {health['overall_health'].upper()}
 
@@ -410,20 +569,24 @@ def system_self_awareness(action: str = "", operation: str = "health_check") ->
                 return "❌ **Error**: No action specified for risk assessment"
             
             risk = awareness.assess_action_risk(action)
-            
-            risk_emoji = {"low": "✅", "medium": "⚠️", "high": "🚨"}
+            warnings_block = "\n".join([
+                f"- {warning}" for warning in risk['warnings']
+            ]) if risk['warnings'] else "- No warnings detected"
+            recommendations_block = "\n".join([
+                f"- {rec}" for rec in risk['recommendations']
+            ]) if risk['recommendations'] else "- No specific recommendations"
             
             result = f"""
 # 🔍 **Action Risk Assessment**
 
 ## 📋 **Action**: `{action}`
-## 🎯 **Risk Level**: {risk_emoji.get(risk['risk_level'], '❓')} **{risk['risk_level'].upper()}**
+## 🎯 **Risk Level**: {_RISK_EMOJI.get(risk['risk_level'], '❓')} **{risk['risk_level'].upper()}**
 
 ## ⚠️ **Warnings**:
-{chr(10).join(f"- {warning}" for warning in risk['warnings']) if risk['warnings'] else "- No warnings detected"}
+{warnings_block}
 
 ## 💡 **Recommendations**:
-{chr(10).join(f"- {rec}" for rec in risk['recommendations']) if risk['recommendations'] else "- No specific recommendations"}
+{recommendations_block}
 
 ## 🚦 **Safe to Proceed**: {'✅ Yes' if risk['safe_to_proceed'] else '❌ No - Exercise Caution'}
 
@@ -453,11 +616,12 @@ def system_self_awareness(action: str = "", operation: str = "health_check") ->
         
         elif operation == "recovery":
             recommendations = awareness.get_recovery_recommendations()
+            recommendations_block = "\n".join([f"- {rec}" for rec in recommendations])
             
             return f"""
 # 🔧 **Recovery Recommendations**
 
-{chr(10).join(f"- {rec}" for rec in recommendations)}
+{recommendations_block}
 
 **Generated**: {datetime.now().isoformat()}
 """